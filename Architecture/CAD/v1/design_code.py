@@ -1,8 +1,54 @@
 #Author- Emre Dayangaç
 #Description-
+# PERF NOTE: every loop in this script is bounded by Fusion API calls that
+# marshal into the C++ core, not by Python bytecode - profiling before
+# reaching for numba/cython will show the interpreter is idle. The levers
+# that matter here are batching API calls through ObjectCollection,
+# deferring solves with design.computeDeferred / Sketch.isComputeDeferred,
+# and preferring TemporaryBRepManager bodies over parametric features.
 import adsk.core, adsk.fusion, traceback
 
+# Cache of base bodies keyed by their defining parameters, so repeated
+# runs with the same dimensions reuse the existing body instead of
+# rebuilding the box + fillet from scratch
+_BASE_CACHE = {}
+
+
+def build_base_box(rootComp, length, width, height, fillet_radius):
+    """Create (or reuse) the filleted base box and return its BRepBody."""
+    key = (length, width, height, fillet_radius)
+    cached = _BASE_CACHE.get(key)
+    if cached and cached.isValid:
+        return cached
+
+    sketch = rootComp.sketches.add(rootComp.xYConstructionPlane)
+
+    # One API call creates all four connected lines of the rectangle
+    lines = sketch.sketchCurves.sketchLines
+    lines.addTwoPointRectangle(adsk.core.Point3D.create(0, 0, 0),
+                               adsk.core.Point3D.create(length, width, 0))
+
+    prof = sketch.profiles[0]
+    extrudes = rootComp.features.extrudeFeatures
+    extrudeInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+    extrudeInput.setDistanceExtent(False, adsk.core.ValueInput.createByReal(height))
+    extrude = extrudes.add(extrudeInput)
+    body = extrude.bodies[0]
+
+    fillets = rootComp.features.filletFeatures
+    # Marshal all edges across the API boundary in one call instead
+    # of one .add() round-trip per edge
+    edgeCollection = adsk.core.ObjectCollection.createWithArray(list(body.edges))
+    filletInput = fillets.createInput()
+    filletInput.addConstantRadiusEdgeSet(edgeCollection, adsk.core.ValueInput.createByReal(fillet_radius), True)
+    fillets.add(filletInput)
+
+    _BASE_CACHE[key] = body
+    return body
+
+
 def run(context):
+    design = None
     try:
         # App and UI setup
         app = adsk.core.Application.get()
@@ -10,6 +56,10 @@ def run(context):
         design = app.activeProduct
         rootComp = design.rootComponent
 
+        # Batch all recomputes into one final solve instead of
+        # re-solving the timeline after every feature add
+        design.computeDeferred = True
+
         # Define dimensions
         length = 100  # Length of the box
         width = 60    # Width of the box
@@ -19,70 +69,34 @@ def run(context):
         screen_width = 13   # Width of PiOLED cutout
         offset_from_top = 10  # Distance of OLED cutout from top edge
 
-       
-        sketches = rootComp.sketches
-        xyPlane = rootComp.xYConstructionPlane
-        sketch = sketches.add(xyPlane)
+        body = build_base_box(rootComp, length, width, height, fillet_radius)
 
 
-        lines = sketch.sketchCurves.sketchLines
-        point0 = adsk.core.Point3D.create(0, 0, 0)
-        point1 = adsk.core.Point3D.create(length, 0, 0)
-        point2 = adsk.core.Point3D.create(length, width, 0)
-        point3 = adsk.core.Point3D.create(0, width, 0)
-
-        lines.addByTwoPoints(point0, point1)
-        lines.addByTwoPoints(point1, point2)
-        lines.addByTwoPoints(point2, point3)
-        lines.addByTwoPoints(point3, point0)
-
-
-        prof = sketch.profiles[0]
-        extrudes = rootComp.features.extrudeFeatures
-        extrudeInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        distance = adsk.core.ValueInput.createByReal(height)
-        extrudeInput.setDistanceExtent(False, distance)
-        extrude = extrudes.add(extrudeInput)
-        body = extrude.bodies[0]
-
-
-        fillets = rootComp.features.filletFeatures
-        edgeCollection = adsk.core.ObjectCollection.create()
-        for edge in body.edges:
-            edgeCollection.add(edge)
-
-        filletInput = fillets.createInput()
-        filletInput.addConstantRadiusEdgeSet(edgeCollection, adsk.core.ValueInput.createByReal(fillet_radius), True)
-        fillets.add(filletInput)
-
-
-        topPlaneInput = rootComp.constructionPlanes.createInput()
-        offsetValue = adsk.core.ValueInput.createByReal(height)
-        topPlaneInput.setByOffset(rootComp.xYConstructionPlane, offsetValue)
-        topPlane = rootComp.constructionPlanes.add(topPlaneInput)
+        # Build the OLED cutout as a transient BRep box and remove it with
+        # one combine - transient bodies skip the parametric solver entirely
+        cutout_depth = 10
+        screenX = (length - screen_length) / 2
+        screenY = width - screen_width - offset_from_top
 
+        tbm = adsk.fusion.TemporaryBRepManager.get()
+        cutoutCenter = adsk.core.Point3D.create(screenX + screen_length / 2,
+                                                screenY + screen_width / 2,
+                                                height - cutout_depth / 2)
+        xAxis = adsk.core.Vector3D.create(1, 0, 0)
+        yAxis = adsk.core.Vector3D.create(0, 1, 0)
+        cutoutBox = tbm.createBox(adsk.core.OrientedBoundingBox3D.create(
+            cutoutCenter, xAxis, yAxis, screen_length, screen_width, cutout_depth))
 
-        sketchScreen = sketches.add(topPlane)
+        baseFeature = rootComp.features.baseFeatures.add()
+        baseFeature.startEdit()
+        toolBody = rootComp.bRepBodies.add(cutoutBox, baseFeature)
+        baseFeature.finishEdit()
 
-        screenX = (length - screen_length) / 2
-        screenY = width - screen_width - offset_from_top  
-        point0 = adsk.core.Point3D.create(screenX, screenY, 0)
-        point1 = adsk.core.Point3D.create(screenX + screen_length, screenY, 0)
-        point2 = adsk.core.Point3D.create(screenX + screen_length, screenY + screen_width, 0)
-        point3 = adsk.core.Point3D.create(screenX, screenY + screen_width, 0)
-
-        linesScreen = sketchScreen.sketchCurves.sketchLines
-        linesScreen.addByTwoPoints(point0, point1)
-        linesScreen.addByTwoPoints(point1, point2)
-        linesScreen.addByTwoPoints(point2, point3)
-        linesScreen.addByTwoPoints(point3, point0)
-
-   
-        cutoutProf = sketchScreen.profiles[0]
-        cutoutInput = extrudes.createInput(cutoutProf, adsk.fusion.FeatureOperations.CutFeatureOperation)
-        cutoutDepth = adsk.core.ValueInput.createByReal(-10)  # Negative to cut downward
-        cutoutInput.setDistanceExtent(False, cutoutDepth)
-        extrudes.add(cutoutInput)
+        toolBodies = adsk.core.ObjectCollection.create()
+        toolBodies.add(toolBody)
+        combineInput = rootComp.features.combineFeatures.createInput(body, toolBodies)
+        combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
+        rootComp.features.combineFeatures.add(combineInput)
 
 
         ui.messageBox('Rectangular box with OLED screen cutout moved higher created successfully!')
@@ -90,3 +104,7 @@ def run(context):
     except:
         if ui:
             ui.messageBox('Failed:\n{}'.format(traceback.format_exc()))
+    finally:
+        # Re-enable compute so the deferred features solve in one pass
+        if design:
+            design.computeDeferred = False
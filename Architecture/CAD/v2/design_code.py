@@ -1,13 +1,63 @@
+# PERF NOTE: the hot path in this script is the Fusion API boundary, not
+# Python itself - none of the loops are numeric, so JIT compilers (numba
+# etc.) have nothing to speed up. Optimize by cutting API crossings:
+# batch inputs via ObjectCollection, keep compute deferred while building
+# (design.computeDeferred, Sketch.isComputeDeferred), use pattern features
+# for repeats, and build one-off tool bodies with TemporaryBRepManager.
 import adsk.core, adsk.fusion, traceback
 
+# Cache of base bodies keyed by their defining parameters, so repeated
+# runs with the same dimensions reuse the existing body instead of
+# rebuilding the box + fillet from scratch
+_BASE_CACHE = {}
+
+
+def build_base_box(rootComp, length, width, height, fillet_radius):
+    """Create (or reuse) the filleted base box and return its BRepBody."""
+    key = (length, width, height, fillet_radius)
+    cached = _BASE_CACHE.get(key)
+    if cached and cached.isValid:
+        return cached
+
+    sketch = rootComp.sketches.add(rootComp.xYConstructionPlane)
+
+    # One API call creates all four connected lines of the rectangle
+    lines = sketch.sketchCurves.sketchLines
+    lines.addTwoPointRectangle(adsk.core.Point3D.create(0, 0, 0),
+                               adsk.core.Point3D.create(length, width, 0))
+
+    prof = sketch.profiles[0]
+    extrudes = rootComp.features.extrudeFeatures
+    extrudeInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+    extrudeInput.setDistanceExtent(False, adsk.core.ValueInput.createByReal(height))
+    extrude = extrudes.add(extrudeInput)
+    body = extrude.bodies[0]
+
+    fillets = rootComp.features.filletFeatures
+    # Marshal all edges across the API boundary in one call instead
+    # of one .add() round-trip per edge
+    edgeCollection = adsk.core.ObjectCollection.createWithArray(list(body.edges))
+    filletInput = fillets.createInput()
+    filletInput.addConstantRadiusEdgeSet(edgeCollection, adsk.core.ValueInput.createByReal(fillet_radius), True)
+    fillets.add(filletInput)
+
+    _BASE_CACHE[key] = body
+    return body
+
+
 def run(context):
+    design = None
     try:
-     
+
         app = adsk.core.Application.get()
         ui = app.userInterface
         design = app.activeProduct
         rootComp = design.rootComponent
 
+        # Batch all recomputes into one final solve instead of
+        # re-solving the timeline after every feature add
+        design.computeDeferred = True
+
     
         length = 100 
         width = 60    
@@ -25,39 +75,9 @@ def run(context):
 
 
         sketches = rootComp.sketches
-        xyPlane = rootComp.xYConstructionPlane
-        sketch = sketches.add(xyPlane)
-
-        
-        lines = sketch.sketchCurves.sketchLines
-        point0 = adsk.core.Point3D.create(0, 0, 0)
-        point1 = adsk.core.Point3D.create(length, 0, 0)
-        point2 = adsk.core.Point3D.create(length, width, 0)
-        point3 = adsk.core.Point3D.create(0, width, 0)
-
-        lines.addByTwoPoints(point0, point1)
-        lines.addByTwoPoints(point1, point2)
-        lines.addByTwoPoints(point2, point3)
-        lines.addByTwoPoints(point3, point0)
-
-        
-        prof = sketch.profiles[0]
         extrudes = rootComp.features.extrudeFeatures
-        extrudeInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        distance = adsk.core.ValueInput.createByReal(height)
-        extrudeInput.setDistanceExtent(False, distance)
-        extrude = extrudes.add(extrudeInput)
-        body = extrude.bodies[0]
 
-    
-        fillets = rootComp.features.filletFeatures
-        edgeCollection = adsk.core.ObjectCollection.create()
-        for edge in body.edges:
-            edgeCollection.add(edge)
-
-        filletInput = fillets.createInput()
-        filletInput.addConstantRadiusEdgeSet(edgeCollection, adsk.core.ValueInput.createByReal(fillet_radius), True)
-        fillets.add(filletInput)
+        body = build_base_box(rootComp, length, width, height, fillet_radius)
 
         
         topPlaneInput = rootComp.constructionPlanes.createInput()
@@ -66,61 +86,103 @@ def run(context):
         topPlane = rootComp.constructionPlanes.add(topPlaneInput)
 
         
-        sketchScreen = sketches.add(topPlane)
+        # Build the OLED cutout as a transient BRep box and remove it with
+        # one combine - transient bodies skip the parametric solver entirely
+        cutout_depth = 5
         screenX = (length - screen_length) / 2
         screenY = width - screen_width - offset_from_top
-        point0 = adsk.core.Point3D.create(screenX, screenY, 0)
-        point1 = adsk.core.Point3D.create(screenX + screen_length, screenY, 0)
-        point2 = adsk.core.Point3D.create(screenX + screen_length, screenY + screen_width, 0)
-        point3 = adsk.core.Point3D.create(screenX, screenY + screen_width, 0)
 
-        linesScreen = sketchScreen.sketchCurves.sketchLines
-        linesScreen.addByTwoPoints(point0, point1)
-        linesScreen.addByTwoPoints(point1, point2)
-        linesScreen.addByTwoPoints(point2, point3)
-        linesScreen.addByTwoPoints(point3, point0)
+        tbm = adsk.fusion.TemporaryBRepManager.get()
+        cutoutCenter = adsk.core.Point3D.create(screenX + screen_length / 2,
+                                                screenY + screen_width / 2,
+                                                height - cutout_depth / 2)
+        xAxis = adsk.core.Vector3D.create(1, 0, 0)
+        yAxis = adsk.core.Vector3D.create(0, 1, 0)
+        cutoutBox = tbm.createBox(adsk.core.OrientedBoundingBox3D.create(
+            cutoutCenter, xAxis, yAxis, screen_length, screen_width, cutout_depth))
 
-        cutoutProf = sketchScreen.profiles[0]
-        cutoutInput = extrudes.createInput(cutoutProf, adsk.fusion.FeatureOperations.CutFeatureOperation)
-        cutoutDepth = adsk.core.ValueInput.createByReal(-5)
-        cutoutInput.setDistanceExtent(False, cutoutDepth)
-        extrudes.add(cutoutInput)
+        baseFeature = rootComp.features.baseFeatures.add()
+        baseFeature.startEdit()
+        toolBody = rootComp.bRepBodies.add(cutoutBox, baseFeature)
+        baseFeature.finishEdit()
 
+        toolBodies = adsk.core.ObjectCollection.create()
+        toolBodies.add(toolBody)
+        combineInput = rootComp.features.combineFeatures.createInput(body, toolBodies)
+        combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
+        rootComp.features.combineFeatures.add(combineInput)
 
-        sketchButtons = sketches.add(topPlane)
-        spacing = (length - 7 * circle_diameter) / 8  
 
-        
-        for i in range(7):
-            centerX = spacing + (i+0.25) * (circle_diameter + spacing)
-            centerY = width / 3 
-            sketchButtons.sketchCurves.sketchCircles.addByCenterRadius(
-                adsk.core.Point3D.create(centerX, centerY, 0), circle_diameter / 2
-            )
-        
-
-        for side in [-0.1, 0.5]:  
-            for i in range(2): 
-                buttonX = screenX + (square_offset_x * side) 
+        sketchButtons = sketches.add(topPlane)
+        spacing = (length - 7 * circle_diameter) / 8
+
+        # Solve the button sketch once after all curves are in
+        sketchButtons.isComputeDeferred = True
+
+        # Hoist loop invariants - every Point3D/ValueInput create crosses
+        # into the Fusion core, so build constants once and reuse them
+        circleCenterY = width / 3
+        circleRadius = circle_diameter / 2
+
+        # Sketch only the first circular button; the other six are
+        # replicated with a rectangular pattern after the extrude
+        sketchButtons.sketchCurves.sketchCircles.addByCenterRadius(
+            adsk.core.Point3D.create(spacing + 0.25 * (circle_diameter + spacing),
+                                     circleCenterY, 0),
+            circleRadius
+        )
+
+        squareHalf = square_button_size / 2
+        sketchLines = sketchButtons.sketchCurves.sketchLines
+        for side in [-0.1, 0.5]:
+            buttonX = screenX + (square_offset_x * side)
+            for i in range(2):
                 buttonY = (screenY-5) + i * (square_button_size + square_button_spacing)
 
-                sketchButtons.sketchCurves.sketchLines.addCenterPointRectangle(
+                sketchLines.addCenterPointRectangle(
                     adsk.core.Point3D.create(buttonX, buttonY, 0),
-                    adsk.core.Point3D.create(buttonX + square_button_size / 2, buttonY + square_button_size / 2, 0)
+                    adsk.core.Point3D.create(buttonX + squareHalf, buttonY + squareHalf, 0)
                 )
 
-
-        for profile in sketchButtons.profiles:
-            extrudeInput = extrudes.createInput(profile, adsk.fusion.FeatureOperations.JoinFeatureOperation)
-            extrudeInput.setDistanceExtent(False, adsk.core.ValueInput.createByReal(button_height))
-            extrudes.add(extrudeInput)
-
-
-        for profile in sketchButtons.profiles:
-            extrudeInput = extrudes.createInput(profile, adsk.fusion.FeatureOperations.JoinFeatureOperation)
-            extrudeHeight = adsk.core.ValueInput.createByReal(button_height)
-            extrudeInput.setDistanceExtent(False, extrudeHeight)
-            extrudes.add(extrudeInput)
+        sketchButtons.isComputeDeferred = False
+
+
+        # Split the circle profile (single curve) from the square profiles.
+        # Snapshot the live profiles collection once; iterating it directly
+        # re-queries the sketch topology on every access
+        circleProfile = None
+        squareProfiles = adsk.core.ObjectCollection.create()
+        for profile in list(sketchButtons.profiles):
+            if profile.profileLoops.item(0).profileCurves.count == 1:
+                circleProfile = profile
+            else:
+                squareProfiles.add(profile)
+
+        # Build the extent definition once up front; setDistanceExtent
+        # allocates a fresh definition internally on every call
+        buttonExtentDef = adsk.fusion.DistanceExtentDefinition.create(
+            adsk.core.ValueInput.createByReal(button_height))
+
+        # Extrude the single circular button, then pattern it 7x along X -
+        # one patterned feature instead of seven independent joins
+        circleInput = extrudes.createInput(circleProfile, adsk.fusion.FeatureOperations.JoinFeatureOperation)
+        circleInput.setOneSideExtent(buttonExtentDef, adsk.fusion.ExtentDirections.PositiveExtentDirection)
+        circleFeature = extrudes.add(circleInput)
+
+        patternEntities = adsk.core.ObjectCollection.create()
+        patternEntities.add(circleFeature)
+        patternFeatures = rootComp.features.rectangularPatternFeatures
+        patternInput = patternFeatures.createInput(
+            patternEntities, rootComp.xConstructionAxis,
+            adsk.core.ValueInput.createByReal(7),
+            adsk.core.ValueInput.createByReal(circle_diameter + spacing),
+            adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
+        patternFeatures.add(patternInput)
+
+        # Extrude the square buttons in one batched feature as before
+        extrudeInput = extrudes.createInput(squareProfiles, adsk.fusion.FeatureOperations.JoinFeatureOperation)
+        extrudeInput.setOneSideExtent(buttonExtentDef, adsk.fusion.ExtentDirections.PositiveExtentDirection)
+        extrudes.add(extrudeInput)
 
         
 
@@ -129,3 +191,7 @@ def run(context):
     except:
         if ui:
             ui.messageBox('Failed:\n{}'.format(traceback.format_exc()))
+    finally:
+        # Re-enable compute so the deferred features solve in one pass
+        if design:
+            design.computeDeferred = False
@@ -4,12 +4,20 @@ import pygame
 import time
 import sys
 import socket
+import selectors
+import struct
 import threading
 import json
+import collections
+import concurrent.futures
+import functools
+import heapq
+import operator
 import random
 import os
 import hashlib
-import uuid
+import secrets
+import numpy as np
 from constants import WIDTH, HEIGHT, BG_COLOR, TEXT_COLOR, INSTRUMENTS, INSTRUMENT_NAMES, FREQS
 from sound_engine import play_note, play_error_sound
 from music_parser import parse_music_data
@@ -50,10 +58,102 @@ BUTTON_BORDER = (80, 80, 100) # Button border
 PIANO_COLOR = (100, 149, 237) # Light blue for piano notes
 GUITAR_COLOR = (255, 165, 0)  # Orange for guitar notes
 
+# Length-prefixed TCP framing: 4-byte big-endian payload size followed by
+# the encoded payload, so the receiver never has to guess message bounds
+FRAME_HEADER = struct.Struct("!I")
+
+def encode_message(message_data):
+    """Encode a protocol message dict to bytes"""
+    # Compact separators: no cosmetic whitespace on the wire
+    return json.dumps(message_data, separators=(',', ':')).encode()
+
+def decode_message(payload):
+    """Decode a protocol message payload back into a dict.
+
+    json.loads accepts bytes directly, so the payload never goes
+    through an intermediate str - one allocation less per message.
+    """
+    return json.loads(payload)
+
+# First payload byte selects the decode path: a compact binary format
+# for the high-rate note events, JSON for the rare control messages
+MSG_ID_JSON = 0
+MSG_ID_NOTE_PLAYED = 2
+
+# note_played wire format: msg_id:u8, note_idx:u8, octave:u8,
+# instrument:u8, start_time:f32 - 8 bytes vs ~100 as framed JSON
+NOTE_PLAYED_STRUCT = struct.Struct("!BBBBf")
+NOTE_NAMES = tuple(FREQS.keys())
+NOTE_INDEX = {name: i for i, name in enumerate(NOTE_NAMES)}
+
+# Parsed song notes as immutable slot records: attribute access is a
+# C-level index instead of a dict hash probe per field, and the default
+# instrument is resolved once at load time rather than per dispatch
+Note = collections.namedtuple(
+    'Note', ('note', 'octave', 'duration', 'volume', 'instrument', 'start_time'))
+
+def frame_message(message_data):
+    """Encode a message and prepend its length prefix for TCP transport"""
+    payload = encode_message(message_data)
+    return FRAME_HEADER.pack(len(payload) + 1) + bytes((MSG_ID_JSON,)) + payload
+
+# Keepalive frames differ only in their timestamps, so splice those into
+# preassembled JSON templates instead of walking a dict through the
+# encoder every 5 seconds
+def frame_ping():
+    """Build a framed ping without running the JSON encoder"""
+    payload = f'{{"type":"ping","timestamp":{time.time()!r}}}'.encode()
+    return FRAME_HEADER.pack(len(payload) + 1) + bytes((MSG_ID_JSON,)) + payload
+
+def frame_pong(echo):
+    """Build a framed pong echoing the ping's timestamp"""
+    if not isinstance(echo, (int, float)):
+        echo = 0
+    payload = f'{{"type":"pong","timestamp":{time.time()!r},"echo":{echo!r}}}'.encode()
+    return FRAME_HEADER.pack(len(payload) + 1) + bytes((MSG_ID_JSON,)) + payload
+
+def tune_tcp_socket(sock):
+    """Apply low-latency options to a connected TCP socket"""
+    # Without TCP_NODELAY small note messages can sit up to ~40ms in the
+    # kernel waiting to be coalesced - audible jitter for live playback
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+    # Let dead peers surface through keepalive instead of recv timeouts
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+def tune_udp_socket(sock):
+    """Allow address and port reuse on a discovery UDP socket"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):  # Linux/BSD
+        # Lets two app instances on one host share the discovery ports
+        # instead of one falling back to a random port
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
 # Global variable to store active slaves
 active_slaves = {}
 
-# Debug flag - set to True to see detailed network logs
+# Bumped on every active_slaves mutation so readers can keep a cheap
+# snapshot of the roster and only rebuild it when this number moves
+active_slaves_revision = 0
+
+def bump_slaves_revision():
+    """Mark the slave roster as changed"""
+    global active_slaves_revision
+    active_slaves_revision += 1
+
+# Cap on how many slaves we track at once; the oldest-seen entry is
+# evicted on overflow so the dict can't grow without bound
+MAX_TRACKED_SLAVES = 64
+
+# Debug flag - set to True to see detailed network logs. Hot-path call
+# sites are gated with `if DEBUG:` so the f-string (and any dict repr it
+# forces) is never even built when debug is off
 DEBUG = True
 
 def debug_print(message):
@@ -76,8 +176,52 @@ def get_local_ip():
         # Fall back to localhost if we can't determine IP
         return "127.0.0.1"
 
+# Status-string to display-color mappings, memoized so the substring
+# cascades run once per distinct status value instead of every frame.
+# Each screen keeps its own rules (they intentionally differ)
+
+@functools.lru_cache(maxsize=32)
+def master_status_color(status):
+    if status == "Disconnected" or "Error" in status:
+        return STATUS_RED
+    if "Connected" in status:
+        return STATUS_GREEN
+    return STATUS_ORANGE
+
+@functools.lru_cache(maxsize=32)
+def slave_status_color(status):
+    if "Discovered" in status:
+        return STATUS_ORANGE
+    if "Connected" in status:
+        return STATUS_GREEN
+    if status == "Disconnected" or "Error" in status:
+        return STATUS_RED
+    if "Limited" in status:
+        return (255, 200, 0)  # Darker orange for limited discovery
+    return STATUS_ORANGE
+
+@functools.lru_cache(maxsize=32)
+def select_status_color(status):
+    if "Error" in status:
+        return STATUS_RED
+    if "Connected" in status:
+        return STATUS_GREEN
+    if "timeout" in status.lower():
+        return STATUS_RED
+    return STATUS_ORANGE
+
+@functools.lru_cache(maxsize=32)
+def playback_status_color(status):
+    if "Error" in status:
+        return STATUS_RED
+    if "Playing" in status or "Completed" in status:
+        return STATUS_GREEN
+    return STATUS_ORANGE
+
 # Fallback test track - Simple Twinkle Twinkle Little Star
 FALLBACK_TRACK = """Do4-0.0-0.5-100-0 Do4-0.5-0.5-100-0 Sol4-1.0-0.5-100-0 Sol4-1.5-0.5-100-0 La4-2.0-0.5-100-0 La4-2.5-0.5-100-0 Sol4-3.0-1.0-100-0 Fa4-4.0-0.5-100-1 Fa4-4.5-0.5-100-1 Mi4-5.0-0.5-100-1 Mi4-5.5-0.5-100-1 Re4-6.0-0.5-100-1 Re4-6.5-0.5-100-1 Do4-7.0-1.0-100-1"""
+# Encoded once so the fallback path hashes without a per-load encode
+FALLBACK_TRACK_BYTES = FALLBACK_TRACK.encode()
 
 class MusicConnection:
     """Class to handle multiplayer music connections"""
@@ -95,6 +239,87 @@ class MusicConnection:
         self.small_font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 64)
         self.clock = pygame.time.Clock()
+
+        # LRU cache of rendered text surfaces keyed by (font, text,
+        # color). Status strings change a few times per second at most,
+        # so re-rendering them at 60fps is wasted glyph rasterization;
+        # eviction keeps stale strings from accumulating
+        self._render_text = functools.lru_cache(maxsize=128)(self._render_text_uncached)
+
+        # Companion cache that also bakes in the centered (x, y)
+        # position, so hits skip the get_width/centering math too
+        self._render_centered = functools.lru_cache(maxsize=128)(self._render_centered_uncached)
+
+        # fblits amortizes the Python->C crossing over a whole sequence
+        # of (surface, pos) pairs and skips per-blit rect returns; fall
+        # back to blits on pygame builds that predate it (< 2.1.4)
+        self._blit_batch = getattr(self.screen, 'fblits', self.screen.blits)
+
+        # Signature of what the menu screens last painted; draw() skips
+        # the repaint while it matches (see draw)
+        self._last_draw_signature = object()
+
+        # Fully composed button surfaces keyed by (label, size); see
+        # draw_button
+        self._button_cache = {}
+
+        # Cached list of slave ids, tied to the roster revision counter
+        self._slave_ids_snapshot = []
+        self._slave_ids_revision = -1
+
+        # Reused progress-bar rects: the fill width mutates in place
+        # instead of allocating fresh tuples every frame
+        self._progress_bg_rect = pygame.Rect(100, 180, WIDTH - 200, 20)
+        self._progress_fill_rect = pygame.Rect(100, 180, 0, 20)
+
+        # Static stage band for the playing screen: the section
+        # backgrounds, divider line and instrument labels never change,
+        # so bake them into one opaque surface blitted per frame instead
+        # of re-issuing the draw primitives
+        divider_y = HEIGHT // 2
+        self._stage_top = divider_y - 170
+        self._stage_surf = pygame.Surface((WIDTH, 340))
+        self._stage_surf.fill(BG_COLOR)
+        # Piano section background (top half of the band)
+        pygame.draw.rect(self._stage_surf, (40, 40, 60), (100, 0, WIDTH - 200, 120))
+        # Guitar section background (below the divider)
+        pygame.draw.rect(self._stage_surf, (60, 40, 40), (100, 220, WIDTH - 200, 120))
+        # Divider line between instruments
+        pygame.draw.line(self._stage_surf, (100, 100, 100), (0, 170), (WIDTH, 170), 2)
+        # Instrument labels
+        self._stage_surf.blit(
+            self.font.render(f"Piano ({INSTRUMENT_NAMES[INSTRUMENTS['PIANO']]})",
+                             True, PIANO_COLOR, BG_COLOR), (20, 130))
+        self._stage_surf.blit(
+            self.font.render(f"Electro Guitar ({INSTRUMENT_NAMES[INSTRUMENTS['ELECTRO_GUITAR']]})",
+                             True, GUITAR_COLOR, BG_COLOR), (20, 180))
+
+        # Instruction lines never change, so rasterize them (and their
+        # centered positions) once here instead of per frame per screen
+        self._role_instr = self._prep_instructions([
+            "Press 'A' to switch between options",
+            "Press 'Enter' to select",
+            "Press 'Esc' to return to main menu"
+        ], HEIGHT - 150)
+        self._master_instr = self._prep_instructions([
+            "Press 'S' to scan for slaves",
+            "Press 'L' to load track",
+            "Press 'Esc' to return to role selection"
+        ], HEIGHT - 120)
+        self._slave_instr = self._prep_instructions([
+            "Press 'L' to load track",
+            "Press 'Esc' to return to role selection"
+        ], HEIGHT - 100)
+        self._slave_select_instr = self._prep_instructions([
+            "Up/Down to select a slave",
+            "Press 'Enter' to connect",
+            "Press 'R' to refresh list",
+            "Press 'Esc' to return"
+        ], HEIGHT - 100, line_height=25)
+        self._connected_instr = self._prep_instructions([
+            "Press 'P' to start playing",
+            "Press 'Esc' to disconnect and return"
+        ], HEIGHT - 100)
         
         # Connection state
         self.state = ROLE_SELECTION
@@ -105,17 +330,36 @@ class MusicConnection:
         self.selected_slave_index = 0
         
         # Unique ID for this instance (used for slave mode)
-        self.id = str(uuid.uuid4())[:8]  # Using first 8 chars of UUID for readability
+        self.id = secrets.token_hex(4)  # 8 hex chars, no UUID stringify/slice detour
         
         # Socket related
         self.socket = None
         self.client_socket = None
-        self.server_thread = None
-        self.connection_thread = None
-        self.discovery_thread = None
+        # Whichever socket currently talks to the peer (client_socket for
+        # the master, socket for the slave) - lets the send paths skip
+        # role branching and attribute checks
+        self._active_sock = None
         self.broadcast_socket = None
         self.response_socket = None
-        
+        self.slave_response_socket = None
+
+        # Worker threads only park in selectors and run shallow call
+        # stacks, so cap their stack reservation well below the ~8MB
+        # Linux default before the pool spawns them
+        try:
+            threading.stack_size(256 * 1024)
+        except (ValueError, RuntimeError):
+            pass
+
+        # One persistent worker pool instead of a fresh daemon thread per
+        # handler - reconnects reuse pooled threads rather than paying
+        # thread creation plus a blind 0.5s stall each time
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='musicco')
+        self.server_task = None
+        self.connection_task = None
+        self.discovery_task = None
+
         # Thread control
         self.discovery_running = False
         self.connection_active = False
@@ -132,6 +376,16 @@ class MusicConnection:
         self.track_content = ""
         self.song_data = []
         self.parsed_song_data = []
+        # Sorted start/duration arrays over parsed_song_data for
+        # binary-searching the playback window (see _build_song_arrays)
+        self._note_starts = np.zeros(0, dtype=np.float32)
+        self._note_durations = np.zeros(0, dtype=np.float32)
+        self._note_indices = np.zeros(0, dtype=np.int32)
+        self._note_instruments = np.zeros(0, dtype=np.int32)
+        self._song_end_time = 0.0
+        # Parsed tracks keyed by hash, so reloading the same file skips
+        # the parse and array builds entirely
+        self._track_cache = {}
         
         # Dynamic port tracking
         self.connection_port = SERVER_PORT
@@ -155,36 +409,94 @@ class MusicConnection:
         self.max_song_time = 25.0
         
         # Visual display of notes
-        self.played_notes = []  # Notes played locally or received from remote
-        self.upcoming_notes = []  # Notes that will play soon
-        
+        # Bounded deque so long sessions can't grow it without limit
+        self.played_notes = collections.deque(maxlen=256)  # Notes played locally or received from remote
+
+        # Jitter buffer for remote note events: each entry is (due_time,
+        # note) and is only surfaced once due_time passes, so TCP latency
+        # variance is absorbed by a fixed delay instead of showing up as
+        # jitter. Bounded, dropping oldest on overflow
+        self._jitter_buf = collections.deque(maxlen=32)
+        self._jitter_target_ms = 100
+
+        # Index window of upcoming notes currently on screen; the
+        # display reads the song's column arrays through this window
+        # rather than keeping a separate notes list
+        self._upcoming_window = None
+
+        # Reused transmit buffer for binary note frames: packing into it
+        # avoids allocating fresh bytes objects on every send, keeping GC
+        # churn away from the playback loop (only that loop writes to it).
+        # Frames accumulate at _tx_len so a chord's worth of notes goes
+        # out in one syscall when flushed
+        self._tx_buf = bytearray(4096)
+        self._tx_mv = memoryview(self._tx_buf)
+        self._tx_len = 0
+
+        # Serializes socket writes so heartbeat and playback sends can't
+        # interleave bytes mid-frame
+        self._send_lock = threading.Lock()
+
+        # Wakes the playback loop early when state changes (completion,
+        # returning to connected) so it can sleep until the next note
+        # instead of polling on a fixed tick
+        self._wake = threading.Event()
+
+        # Self-pipe: cleanup writes a byte so the connection handler's
+        # selector wakes immediately instead of waiting out its timeout.
+        # The read end is non-blocking so a handler can drain stale
+        # bytes without risk of hanging
+        self._shutdown_pipe_r, self._shutdown_pipe_w = os.pipe()
+        os.set_blocking(self._shutdown_pipe_r, False)
+
+        # Message dispatch table: process_message resolves handlers with
+        # one dict probe instead of walking an if/elif chain of string
+        # comparisons for every incoming message
+        self._handlers = {
+            "ping": self._on_ping,
+            "pong": self._on_pong,
+            MSG_PLAYBACK_READY: self._on_playback_ready,
+            MSG_NOTE_PLAYED: self._on_note_played,
+            MSG_PLAYBACK_COMPLETE: self._on_playback_complete,
+            MSG_START_PLAYBACK: self._on_start_playback,
+            MSG_CONNECT: self._on_connect,
+            MSG_CONFIRM: self._on_confirm,
+            MSG_ERROR: self._on_error,
+        }
+
         # Try to load track on startup
         self.load_track()
-    
+
+    def _await_task(self, task, timeout=1.0):
+        """Wait briefly for a previous pool task to finish, if still running.
+
+        Callers clear the task's running flag first; this just bounds how
+        long we wait for it to notice instead of stalling a fixed 0.5s.
+        """
+        if task and not task.done():
+            debug_print("Waiting for previous task to terminate")
+            concurrent.futures.wait([task], timeout=timeout)
+
     def start_server(self):
         """Start the discovery process for Master mode"""
         try:
             # Clear any existing slaves
             global active_slaves
             active_slaves.clear()
-            
+            bump_slaves_revision()
+
             # Close any previous sockets
             self.close_sockets()
             
             # Create separate sockets for broadcasting and receiving
             # Broadcasting socket - sends discovery messages
             self.broadcast_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.broadcast_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            # Enable broadcast on supported platforms
-            try:
-                self.broadcast_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            except:
-                debug_print("SO_BROADCAST not supported, multicast may be limited")
-            
+            tune_udp_socket(self.broadcast_socket)
+            self.broadcast_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
             # Response socket - receives slave responses
             self.response_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.response_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            tune_udp_socket(self.response_socket)
             
             # Try to bind to the default response port
             try:
@@ -197,17 +509,13 @@ class MusicConnection:
                 self.response_port = self.response_socket.getsockname()[1]
                 debug_print(f"Using dynamic port {self.response_port} for slave responses")
             
-            # Start discovery flag
+            # Stop and wait out any previous discovery task before
+            # starting a new one on the pool
+            self.discovery_running = False
+            self._await_task(self.discovery_task)
+
             self.discovery_running = True
-            
-            # Start discovery thread
-            if self.discovery_thread and self.discovery_thread.is_alive():
-                debug_print("Waiting for previous discovery thread to terminate")
-                time.sleep(0.5)
-            
-            self.discovery_thread = threading.Thread(target=self.discover_slaves)
-            self.discovery_thread.daemon = True
-            self.discovery_thread.start()
+            self.discovery_task = self._executor.submit(self.discover_slaves)
             
             self.connection_status = "Scanning for slaves..."
             self.state = SLAVE_SELECT
@@ -222,24 +530,39 @@ class MusicConnection:
         """Master thread to send discovery broadcasts and receive responses"""
         try:
             debug_print(f"Starting slave discovery from {self.local_ip}")
-            
+
+            # Sleep in the kernel until a response arrives or the next
+            # broadcast is due, instead of polling with short timeouts
+            self.response_socket.setblocking(False)
+            selector = selectors.DefaultSelector()
+            selector.register(self.response_socket, selectors.EVENT_READ)
+
+            # The discovery message never changes for the lifetime of this
+            # thread, so encode it once instead of on every broadcast
+            discovery_msg = encode_message({
+                "type": MSG_DISCOVERY,
+                "master_id": self.id,
+                "track_hash": self.track_hash,
+                "response_port": self.response_port,
+                "master_ip": self.local_ip  # Include our IP for direct discovery
+            })
+
             # Keep track of the last broadcast time
             last_broadcast = 0
-            
+
+            # Min-heap of (last_seen, slave_id) so stale entries can be
+            # popped in O(k) instead of scanning the whole roster each tick.
+            # Refreshed slaves leave stale heap entries behind; those are
+            # skipped lazily by comparing against the dict's last_seen
+            seen_heap = []
+
             while self.discovery_running and self.state == SLAVE_SELECT:
-                current_time = time.time()
-                
+                # Monotonic clock: last_seen deadlines must not jump when
+                # NTP steps the wall clock
+                current_time = time.monotonic()
+
                 # Send a discovery broadcast every 1 second
                 if current_time - last_broadcast > 1:
-                    # Prepare the discovery message
-                    discovery_msg = json.dumps({
-                        "type": MSG_DISCOVERY,
-                        "master_id": self.id,
-                        "track_hash": self.track_hash,
-                        "response_port": self.response_port,
-                        "master_ip": self.local_ip  # Include our IP for direct discovery
-                    }).encode()
-                    
                     # Try using broadcast to 255.255.255.255
                     try:
                         debug_print(f"Broadcasting discovery to port {MASTER_BROADCAST_PORT}")
@@ -258,50 +581,66 @@ class MusicConnection:
                     
                     last_broadcast = current_time
                 
-                # Check for responses with a non-blocking timeout
-                self.response_socket.settimeout(0.1)
-                try:
-                    data, addr = self.response_socket.recvfrom(4096)
-                    message = json.loads(data.decode())
-                    
-                    if message.get("type") == MSG_DISCOVERY_RESPONSE:
-                        slave_id = message.get("slave_id", "unknown")
-                        slave_track_hash = message.get("track_hash", "")
-                        slave_ip = addr[0]  # Get the IP from the response
-                        
-                        # Store the slave data with its address
-                        if slave_track_hash == self.track_hash:
-                            debug_print(f"Discovered slave: {slave_id} at {addr} with IP {slave_ip}")
-                            
-                            # Update the global active_slaves dictionary
-                            global active_slaves
-                            active_slaves[slave_id] = {
-                                "id": slave_id,
-                                "address": addr,
-                                "ip": slave_ip,
-                                "track_hash": slave_track_hash,
-                                "last_seen": current_time
-                            }
-                            debug_print(f"Updated active_slaves: {list(active_slaves.keys())}")
-                except socket.timeout:
-                    # Expected timeout, just continue
-                    pass
-                except Exception as e:
-                    debug_print(f"Error receiving discovery response: {e}")
-                
-                # Prune old slaves that haven't been seen in 5 seconds
-                slaves_to_remove = []
-                for slave_id, slave_data in active_slaves.items():
-                    if current_time - slave_data.get("last_seen", 0) > 5:
-                        slaves_to_remove.append(slave_id)
-                
-                for slave_id in slaves_to_remove:
-                    debug_print(f"Removing stale slave: {slave_id}")
-                    active_slaves.pop(slave_id, None)
-                
-                # Small delay to prevent CPU hogging
-                time.sleep(0.05)
-                
+                # Wait for a response, or until the next broadcast is due
+                events = selector.select(timeout=max(0.0, last_broadcast + 1 - current_time))
+                # Drain every queued datagram in one wakeup - with N slaves
+                # responding each second this costs one select per batch
+                # instead of one per response
+                while events:
+                    try:
+                        data, addr = self.response_socket.recvfrom(4096)
+                    except BlockingIOError:
+                        # Socket is drained
+                        break
+                    try:
+                        message = decode_message(data)
+
+                        if message.get("type") == MSG_DISCOVERY_RESPONSE:
+                            slave_id = message.get("slave_id", "unknown")
+                            slave_track_hash = message.get("track_hash", "")
+                            slave_ip = addr[0]  # Get the IP from the response
+
+                            # Store the slave data with its address
+                            if slave_track_hash == self.track_hash:
+                                debug_print(f"Discovered slave: {slave_id} at {addr} with IP {slave_ip}")
+
+                                # Update the global active_slaves dictionary
+                                global active_slaves
+                                active_slaves[slave_id] = {
+                                    "id": slave_id,
+                                    "address": addr,
+                                    "ip": slave_ip,
+                                    "track_hash": slave_track_hash,
+                                    "last_seen": current_time
+                                }
+                                heapq.heappush(seen_heap, (current_time, slave_id))
+                                bump_slaves_revision()
+
+                                # Evict the oldest-seen slave if the roster is full
+                                while len(active_slaves) > MAX_TRACKED_SLAVES and seen_heap:
+                                    seen_time, oldest_id = heapq.heappop(seen_heap)
+                                    entry = active_slaves.get(oldest_id)
+                                    if entry is None or entry["last_seen"] != seen_time:
+                                        continue
+                                    debug_print(f"Slave roster full, dropping oldest: {oldest_id}")
+                                    del active_slaves[oldest_id]
+                                    bump_slaves_revision()
+                                debug_print(f"Updated active_slaves: {list(active_slaves.keys())}")
+                    except Exception as e:
+                        debug_print(f"Error receiving discovery response: {e}")
+
+                # Prune slaves that haven't been seen in 5 seconds by
+                # popping expired heap entries instead of scanning the dict
+                while seen_heap and seen_heap[0][0] < current_time - 5:
+                    seen_time, stale_id = heapq.heappop(seen_heap)
+                    entry = active_slaves.get(stale_id)
+                    if entry is None or entry["last_seen"] != seen_time:
+                        continue
+                    debug_print(f"Removing stale slave: {stale_id}")
+                    del active_slaves[stale_id]
+                    bump_slaves_revision()
+
+            selector.close()
             debug_print("Discovery thread ending")
             
         except Exception as e:
@@ -326,9 +665,9 @@ class MusicConnection:
     def connect_to_slave(self, slave_info):
         """Connect to a selected slave"""
         try:
-            # Stop discovery
+            # Stop discovery and wait (briefly) for the thread to exit
             self.discovery_running = False
-            time.sleep(0.2)  # Give discovery thread time to clean up
+            self._await_task(self.discovery_task, timeout=0.2)
             
             # Close any existing sockets
             self.close_sockets()
@@ -362,12 +701,12 @@ class MusicConnection:
             
             # Send direct connection request to the slave
             connection_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            connect_msg = json.dumps({
+            connect_msg = encode_message({
                 "type": "connect_request",
                 "master_id": self.id,
                 "address": self.local_ip,
                 "port": self.connection_port
-            }).encode()
+            })
             
             # Send to the slave's address
             slave_addr = slave_info["address"]
@@ -388,14 +727,9 @@ class MusicConnection:
             # Start waiting for connection
             self.connection_status = f"Waiting for slave {slave_info['id']} to connect..."
             
-            # Start server listen thread
-            if self.server_thread and self.server_thread.is_alive():
-                debug_print("Waiting for previous server thread to terminate")
-                time.sleep(0.5)
-                
-            self.server_thread = threading.Thread(target=self.server_listen)
-            self.server_thread.daemon = True
-            self.server_thread.start()
+            # Start server listen task on the pool
+            self._await_task(self.server_task)
+            self.server_task = self._executor.submit(self.server_listen)
             
             return True
         except Exception as e:
@@ -407,16 +741,26 @@ class MusicConnection:
         """Server listening thread for master mode"""
         try:
             debug_print(f"Waiting for slave to connect on {self.local_ip}:{self.connection_port}")
-            
-            # Set a timeout so we can check if we should keep listening
-            self.socket.settimeout(2.0)
-            
+
+            # Block in a selector until a connection arrives, waking every
+            # 2s only to re-check state - same pattern as the discovery
+            # loops, so this thread holds the GIL only while handling work
+            self.socket.setblocking(False)
+            accept_selector = selectors.DefaultSelector()
+            accept_selector.register(self.socket, selectors.EVENT_READ)
+
             # Listen for up to 30 seconds (15 iterations with 2-second timeout)
             for _ in range(15):
                 try:
+                    if not accept_selector.select(timeout=2.0):
+                        raise socket.timeout()
                     self.client_socket, addr = self.socket.accept()
+                    self.client_socket.setblocking(True)
+                    accept_selector.close()
                     debug_print(f"Connection from {addr}")
-                    
+                    tune_tcp_socket(self.client_socket)
+                    self._active_sock = self.client_socket
+
                     # Switch to active connection state
                     self.connection_status = "Connected"
                     self.state = CONNECTION_ACTIVE
@@ -426,22 +770,19 @@ class MusicConnection:
                     self.heartbeat_running = True
                     self.start_heartbeat()
                     
-                    # Handle communication in separate thread
-                    if self.connection_thread and self.connection_thread.is_alive():
-                        debug_print("Waiting for previous connection thread to terminate")
-                        time.sleep(0.5)
-                    
-                    self.connection_thread = threading.Thread(target=self.handle_connection, args=(self.client_socket,))
-                    self.connection_thread.daemon = True
-                    self.connection_thread.start()
+                    # Handle communication on the pool
+                    self._await_task(self.connection_task)
+                    self.connection_task = self._executor.submit(self.handle_connection, self.client_socket)
                     
                     return  # Successful connection, exit the method
-                except socket.timeout:
-                    # This is expected with the timeout, check if we should continue
+                except (socket.timeout, BlockingIOError):
+                    # No connection this round, check if we should continue
                     if self.state != SLAVE_SELECT:
                         debug_print("State changed, no longer selecting slaves")
                         break
-            
+
+            accept_selector.close()
+
             # If we get here, connection timed out
             debug_print("Connection attempt timed out")
             self.connection_status = "Connection timed out"
@@ -469,7 +810,7 @@ class MusicConnection:
             
             # Create discovery socket
             self.broadcast_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.broadcast_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            tune_udp_socket(self.broadcast_socket)
             
             # Bind to the master broadcast port to listen for broadcasts
             try:
@@ -497,18 +838,18 @@ class MusicConnection:
                         self.connection_status = f"Error: Could not bind to any port"
                         return False
             
-            # Flag for discovery thread
+            # One reusable socket for discovery responses - creating and
+            # tearing down a UDP socket per response is pure syscall churn
+            self.slave_response_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            tune_udp_socket(self.slave_response_socket)
+
+            # Stop and wait out any previous discovery task before
+            # starting the listener on the pool
+            self.discovery_running = False
+            self._await_task(self.discovery_task)
+
             self.discovery_running = True
-                
-            # Start listening for discovery in a thread
-            if self.discovery_thread and self.discovery_thread.is_alive():
-                debug_print("Waiting for previous discovery thread to terminate")
-                self.discovery_running = False
-                time.sleep(0.5)
-            
-            self.discovery_thread = threading.Thread(target=self.listen_for_discovery)
-            self.discovery_thread.daemon = True
-            self.discovery_thread.start()
+            self.discovery_task = self._executor.submit(self.listen_for_discovery)
             
             self.connection_status = "Waiting for master to discover..."
             return True
@@ -522,18 +863,33 @@ class MusicConnection:
         try:
             debug_print(f"Slave starting to listen for master broadcasts on {self.local_ip}")
             master_connections = {}  # Track which masters we've responded to
-            
+
+            # The response payload is the same for every master, so encode
+            # it once up front instead of per broadcast
+            response = encode_message({
+                "type": MSG_DISCOVERY_RESPONSE,
+                "slave_id": self.id,
+                "track_hash": self.track_hash,
+                "slave_ip": self.local_ip  # Include our IP
+            })
+
+            # Block in the selector until a broadcast arrives; the 1s
+            # timeout only bounds how often we re-check the slave state
+            self.broadcast_socket.setblocking(False)
+            selector = selectors.DefaultSelector()
+            selector.register(self.broadcast_socket, selectors.EVENT_READ)
+
             while self.discovery_running and self.state == SLAVE_MODE:
-                # Set timeout to allow checking if we're still in slave mode
-                self.broadcast_socket.settimeout(1.0)
-                
+                if not selector.select(timeout=1.0):
+                    continue
+
                 try:
                     data, addr = self.broadcast_socket.recvfrom(4096)
                     sender_ip = addr[0]
                     debug_print(f"Received data from {sender_ip}")
                     
                     try:
-                        message = json.loads(data.decode())
+                        message = decode_message(data)
                         debug_print(f"Slave received message: {message} from {addr}")
                         
                         # Handle different message types
@@ -545,34 +901,23 @@ class MusicConnection:
                             master_ip = message.get("master_ip", sender_ip)
                             
                             # Only respond if our track matches and we haven't responded recently
-                            current_time = time.time()
+                            current_time = time.monotonic()
                             last_response = master_connections.get(master_id, 0)
                             
                             if master_track_hash == self.track_hash and current_time - last_response > 2:
                                 debug_print(f"Discovered by master {master_id} from {addr} with IP {master_ip}")
                                 
-                                # Create a new socket for the response to avoid conflicts
-                                response_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                                
-                                response = json.dumps({
-                                    "type": MSG_DISCOVERY_RESPONSE,
-                                    "slave_id": self.id,
-                                    "track_hash": self.track_hash,
-                                    "slave_ip": self.local_ip  # Include our IP
-                                }).encode()
-                                
                                 # Send to the master's response port on their IP
                                 master_addr = (master_ip, response_port)
                                 debug_print(f"Sending response to master at {master_addr}")
-                                response_socket.sendto(response, master_addr)
-                                
+                                self.slave_response_socket.sendto(response, master_addr)
+
                                 # Also try responding to the sender's address if different
                                 if master_ip != sender_ip:
                                     debug_print(f"Also sending response to sender at {addr}")
-                                    response_socket.sendto(response, (sender_ip, response_port))
-                                    
-                                response_socket.close()
-                                
+                                    self.slave_response_socket.sendto(response, (sender_ip, response_port))
+
+
                                 master_connections[master_id] = current_time
                                 self.connection_status = f"Discovered by master {master_id}"
                                 
@@ -591,12 +936,13 @@ class MusicConnection:
                                 break
                     except json.JSONDecodeError:
                         debug_print(f"Received invalid JSON from {addr}")
-                except socket.timeout:
-                    # This is normal, just continue listening
+                except BlockingIOError:
+                    # Readiness was spurious, just continue listening
                     pass
                 except Exception as e:
                     debug_print(f"Discovery listen error: {e}")
-                    
+
+            selector.close()
             debug_print("Slave discovery thread ending")
                     
         except Exception as e:
@@ -608,6 +954,13 @@ class MusicConnection:
                 except:
                     pass
                 self.broadcast_socket = None
+
+            if hasattr(self, 'slave_response_socket') and self.slave_response_socket:
+                try:
+                    self.slave_response_socket.close()
+                except:
+                    pass
+                self.slave_response_socket = None
             
     def connect_to_master(self, host, port):
         """Connect to a master's server socket"""
@@ -636,6 +989,8 @@ class MusicConnection:
             
             # Reset to blocking mode after connected
             self.socket.settimeout(None)
+            tune_tcp_socket(self.socket)
+            self._active_sock = self.socket
             
             # Send initial connection message with our track hash
             connection_message = {
@@ -652,14 +1007,9 @@ class MusicConnection:
             self.heartbeat_running = True
             self.start_heartbeat()
             
-            # Start connection handler
-            if self.connection_thread and self.connection_thread.is_alive():
-                debug_print("Waiting for previous connection thread to terminate")
-                time.sleep(0.5)
-                
-            self.connection_thread = threading.Thread(target=self.handle_connection, args=(self.socket,))
-            self.connection_thread.daemon = True
-            self.connection_thread.start()
+            # Start connection handler on the pool
+            self._await_task(self.connection_task)
+            self.connection_task = self._executor.submit(self.handle_connection, self.socket)
             
             self.connection_status = "Connected to master"
             self.state = CONNECTION_ACTIVE
@@ -684,51 +1034,148 @@ class MusicConnection:
             if isinstance(message_data, dict) and "timestamp" not in message_data:
                 message_data["timestamp"] = time.time()
                 
-            if not hasattr(self, 'connection_active') or not self.connection_active:
-                if self.selected_role == 0 and hasattr(self, 'client_socket') and self.client_socket:
-                    debug_print("Socket exists but connection not marked active - sending anyway")
-                elif self.selected_role == 1 and hasattr(self, 'socket') and self.socket:
-                    debug_print("Socket exists but connection not marked active - sending anyway")
-                else:
-                    debug_print("Cannot send message - no active connection")
-                    return False
-                
-            # Serialize and send the message
-            msg = json.dumps(message_data).encode()
-            
-            if self.selected_role == 0:  # Master
-                if hasattr(self, 'client_socket') and self.client_socket:
-                    debug_print(f"Master sending: {message_data}")
-                    self.client_socket.send(msg)
-                    # Add a small delay after sending to allow processing
-                    time.sleep(0.1)
-                    return True
-            else:  # Slave
-                if hasattr(self, 'socket') and self.socket:
-                    debug_print(f"Slave sending: {message_data}")
-                    self.socket.send(msg)
-                    # Add a small delay after sending to allow processing
-                    time.sleep(0.1)
-                    return True
-            
-            return False
+            sock = self._active_sock
+            if sock is None:
+                debug_print("Cannot send message - no active connection")
+                return False
+            if not self.connection_active:
+                debug_print("Socket exists but connection not marked active - sending anyway")
+
+            # Serialize the message with its length prefix
+            msg = frame_message(message_data)
+
+            if DEBUG:
+                debug_print(f"Sending: {message_data}")
+            with self._send_lock:
+                sock.sendall(msg)
+            return True
         except Exception as e:
             debug_print(f"Error sending message: {e}")
             return False
-            
+
+    def _send_frame(self, frame):
+        """Send an already-framed message to the peer under the write lock"""
+        sock = self._active_sock
+        if sock is None:
+            return False
+        try:
+            with self._send_lock:
+                sock.sendall(frame)
+            return True
+        except Exception as e:
+            debug_print(f"Error sending frame: {e}")
+            return False
+
+    def send_note_event(self, note, octave, instrument, start_time, flush=True):
+        """Queue a compact binary note event for the connected peer.
+
+        This is the hot path during playback, so it skips the JSON
+        encoding, debug logging and pacing delay of send_message. With
+        flush=False the frame only accumulates in the transmit buffer;
+        the caller batches a whole tick's notes (chords) and sends them
+        with one flush_note_events call.
+        """
+        frame_size = FRAME_HEADER.size + NOTE_PLAYED_STRUCT.size
+        if self._tx_len + frame_size > len(self._tx_buf):
+            self.flush_note_events()
+
+        # Pack into the reused buffer - no per-send allocations
+        FRAME_HEADER.pack_into(self._tx_buf, self._tx_len, NOTE_PLAYED_STRUCT.size)
+        NOTE_PLAYED_STRUCT.pack_into(self._tx_buf, self._tx_len + FRAME_HEADER.size,
+                                     MSG_ID_NOTE_PLAYED, NOTE_INDEX.get(note, 0),
+                                     octave, instrument, start_time)
+        self._tx_len += frame_size
+
+        if flush:
+            return self.flush_note_events()
+        return True
+
+    def flush_note_events(self):
+        """Send every queued note frame in a single syscall.
+
+        The frames are already packed back-to-back in the transmit
+        buffer, so one sendall over the contiguous span gives the same
+        one-syscall-per-chord behavior as sendmsg scatter-gather would,
+        without building a list of per-frame buffers to gather.
+        """
+        if not self._tx_len:
+            return True
+        length, self._tx_len = self._tx_len, 0
+        try:
+            sock = self._active_sock
+            if sock is not None:
+                with self._send_lock:
+                    sock.sendall(self._tx_mv[:length])
+                return True
+            return False
+        except Exception as e:
+            debug_print(f"Error sending note events: {e}")
+            return False
+
     def handle_connection(self, conn):
         """Handle communication with the connected client/server"""
+        sel = None
         try:
-            # Set a longer timeout to prevent premature disconnection
-            conn.settimeout(2.0)  # Use a 2-second timeout
             no_data_count = 0  # Counter for consecutive no-data events
-            
-            while (hasattr(self, 'connection_active') and self.connection_active and 
-                  hasattr(self, 'state') and (self.state == CONNECTION_ACTIVE or self.state == PLAYING_MODE)):
+            recv_buffer = bytearray()  # Accumulates data until a full frame arrives
+
+            # Persistent landing buffer: recv_into reuses it instead of
+            # allocating a fresh bytes object per recv call
+            recv_chunk = bytearray(8192)
+            recv_chunk_mv = memoryview(recv_chunk)
+
+            # Park in a selector watching both the peer socket and the
+            # shutdown pipe, so cleanup can interrupt the wait instantly
+            # instead of waiting out a recv timeout
+            # Keep the socket blocking (sendall elsewhere relies on it);
+            # the timeout is only a safety net for spurious readiness
+            conn.settimeout(2.0)
+
+            # Drain any shutdown byte left over from an Esc pressed
+            # after the previous handler had already exited; a stale
+            # byte would make this fresh connection look like an
+            # instant shutdown request
+            try:
+                while os.read(self._shutdown_pipe_r, 64):
+                    pass
+            except BlockingIOError:
+                pass
+
+            sel = selectors.DefaultSelector()
+            sel.register(conn, selectors.EVENT_READ)
+            sel.register(self._shutdown_pipe_r, selectors.EVENT_READ)
+
+            # Heartbeats ride this selector loop instead of a dedicated
+            # thread: the select timeout is capped at the next heartbeat
+            # deadline, and a ping goes out whenever it passes
+            heartbeat_interval = 5.0
+            next_heartbeat = time.monotonic() + heartbeat_interval
+
+            while (self.connection_active and
+                   (self.state == CONNECTION_ACTIVE or self.state == PLAYING_MODE)):
+                timeout = min(2.0, next_heartbeat - time.monotonic())
+                events = sel.select(timeout=max(timeout, 0))
+
+                if self.heartbeat_running and time.monotonic() >= next_heartbeat:
+                    try:
+                        with self._send_lock:
+                            conn.sendall(frame_ping())
+                    except Exception as e:
+                        debug_print(f"Heartbeat error: {e}")
+                    next_heartbeat = time.monotonic() + heartbeat_interval
+
+                if not events:
+                    continue  # Periodic re-check of the state flags
+
+                if any(key.fileobj == self._shutdown_pipe_r for key, _ in events):
+                    os.read(self._shutdown_pipe_r, 64)  # Drain the signal
+                    debug_print("Connection handler received shutdown signal")
+                    break
+
                 try:
-                    # Receive data
-                    data = conn.recv(4096)
-                    if not data:
+                    # Receive data into the reused buffer
+                    nbytes = conn.recv_into(recv_chunk)
+                    if not nbytes:
                         # Connection might be closed, but don't disconnect immediately
                         # Give it a few more attempts
                         no_data_count += 1
@@ -743,12 +1190,8 @@ class MusicConnection:
                         
                         # Send a ping to check if connection is still alive
                         try:
-                            ping_message = {
-                                "type": "ping",
-                                "timestamp": time.time()
-                            }
-                            msg = json.dumps(ping_message).encode()
-                            conn.send(msg)
+                            with self._send_lock:
+                                conn.sendall(frame_ping())
                             debug_print("Sent ping to verify connection")
                         except:
                             debug_print("Failed to send ping, connection appears dead")
@@ -762,16 +1205,39 @@ class MusicConnection:
                     
                     # Reset no data counter on successful receive
                     no_data_count = 0
-                        
-                    # Parse the message
-                    try:
-                        message = json.loads(data.decode())
-                        debug_print(f"Received message: {message}")
-                        self.process_message(message)
-                    except json.JSONDecodeError:
-                        debug_print(f"Invalid JSON received: {data.decode()}")
+
+                    # Accumulate and parse every complete frame in the buffer
+                    recv_buffer += recv_chunk_mv[:nbytes]
+                    while len(recv_buffer) >= FRAME_HEADER.size:
+                        (payload_len,) = FRAME_HEADER.unpack_from(recv_buffer)
+                        frame_end = FRAME_HEADER.size + payload_len
+                        if len(recv_buffer) < frame_end:
+                            break  # Wait for the rest of this frame
+
+                        # Dispatch on the first payload byte: binary note
+                        # events are unpacked straight out of the receive
+                        # buffer - no payload slice, no JSON
+                        if (payload_len == NOTE_PLAYED_STRUCT.size and
+                                recv_buffer[FRAME_HEADER.size] == MSG_ID_NOTE_PLAYED):
+                            _, note_idx, octave, instrument, start_time = \
+                                NOTE_PLAYED_STRUCT.unpack_from(recv_buffer, FRAME_HEADER.size)
+                            del recv_buffer[:frame_end]
+                            self.process_note_played(NOTE_NAMES[note_idx], octave,
+                                                     instrument, start_time)
+                            continue
+
+                        payload = bytes(recv_buffer[FRAME_HEADER.size:frame_end])
+                        del recv_buffer[:frame_end]
+
+                        try:
+                            message = decode_message(payload[1:])
+                            if DEBUG:
+                                debug_print(f"Received message: {message}")
+                            self.process_message(message)
+                        except json.JSONDecodeError:
+                            debug_print(f"Invalid message payload received: {payload!r}")
                 except socket.timeout:
-                    # Just a timeout for checking connection state
+                    # Readiness was spurious, wait again
                     continue
                 except Exception as e:
                     debug_print(f"Connection receive error: {e}")
@@ -792,6 +1258,8 @@ class MusicConnection:
             self.connection_status = "Disconnected"
             self.connection_active = False
         finally:
+            if sel is not None:
+                sel.close()
             try:
                 conn.close()
             except:
@@ -805,197 +1273,250 @@ class MusicConnection:
                     self.state = SLAVE_MODE
                     # Automatically restart slave mode
                     self.start_slave_mode()
-            
-    def process_message(self, message):
-        """Process incoming messages"""
-        # Check message type
-        if "type" not in message:
-            debug_print("Received message with no type")
-            return
-            
-        msg_type = message["type"]
-        debug_print(f"Processing message of type: {msg_type}")
-        
-        # Handle ping messages to keep connection alive
-        if msg_type == "ping":
-            # Respond with a pong
-            pong_message = {
-                "type": "pong",
-                "timestamp": time.time(),
-                "echo": message.get("timestamp", 0)
-            }
-            self.send_message(pong_message)
-            return
-            
-        # Handle pong responses
-        if msg_type == "pong":
-            # Just log it, no further action needed
-            debug_print("Received pong response")
-            return
-        
-        # Handle playback related messages
-        if msg_type == MSG_PLAYBACK_READY:
-            debug_print("Remote player is ready for playback")
-            self.remote_ready = True
-            
-            # If both are ready and we're in playing mode, start immediately
-            if self.local_ready and self.remote_ready and self.state == PLAYING_MODE:
-                debug_print("Both players ready, starting synchronized playback")
-                if self.selected_role == 0:  # Master controls playback start
-                    self.start_playback()
-            return
-            
-        if msg_type == MSG_NOTE_PLAYED:
-            # Remote player is playing a note - add to visualization only
-            note = message.get("note")
-            octave = message.get("octave")
-            instrument = message.get("instrument")
-            start_time = message.get("start_time", 0)
-            
-            # Add to visualization only - no sound played
-            self.played_notes.append({
+
+    def process_note_played(self, note, octave, instrument, start_time):
+        """Queue a remote note event for visualization.
+
+        The event sits in the jitter buffer behind a fixed delay; the
+        playback loop surfaces it once due, smoothing network jitter.
+        """
+        self._jitter_buf.append((
+            time.monotonic() + self._jitter_target_ms / 1000.0,
+            {
                 'note': note,
                 'octave': octave,
                 'instrument': instrument,
                 'time': start_time
-            })
-            return
-            
-        if msg_type == MSG_PLAYBACK_COMPLETE:
-            debug_print("Remote player has completed playback")
-            self.remote_completed = True
-            
-            # If both completed, return to connected state
-            if self.local_completed and self.remote_completed:
-                debug_print("Playback completed on both sides")
-                self.playback_completed = True
-                self.playback_status = "Completed"
-                
-                # Wait a bit to show completion screen, then return to connected state
-                if self.state == PLAYING_MODE:
-                    # Use a timer to avoid blocking in this thread
-                    timer = threading.Timer(5.0, self.return_to_connected)
-                    timer.daemon = True
-                    timer.start()
+            }
+        ))
+
+    def process_message(self, message):
+        """Dispatch an incoming message to its type handler.
+
+        A dict lookup replaces the old if/elif chain, so every message
+        costs one hash probe instead of up to nine string comparisons.
+        """
+        handler = self._handlers.get(message.get("type"))
+        if handler is None:
+            debug_print(f"Received message with unknown type: {message.get('type')}")
             return
-            
-        if msg_type == MSG_START_PLAYBACK:
-            # Master has signaled to start playback
-            debug_print("Received start playback signal from master")
-            if self.state == PLAYING_MODE:
-                # Start playback immediately when master says so
+        handler(message)
+
+    def _on_ping(self, message):
+        """Respond with a templated pong - no dict or encoder pass"""
+        self._send_frame(frame_pong(message.get("timestamp", 0)))
+
+    def _on_pong(self, message):
+        """Pong responses just confirm the connection is alive"""
+        debug_print("Received pong response")
+
+    def _on_playback_ready(self, message):
+        """Remote player signaled it is ready for playback"""
+        debug_print("Remote player is ready for playback")
+        self.remote_ready = True
+
+        # If both are ready and we're in playing mode, start immediately
+        if self.local_ready and self.remote_ready and self.state == PLAYING_MODE:
+            debug_print("Both players ready, starting synchronized playback")
+            if self.selected_role == 0:  # Master controls playback start
                 self.start_playback()
+
+    def _on_note_played(self, message):
+        """Remote player is playing a note - add to visualization only"""
+        self.process_note_played(message.get("note"), message.get("octave"),
+                                 message.get("instrument"),
+                                 message.get("start_time", 0))
+
+    def _on_playback_complete(self, message):
+        """Remote player finished its part of the song"""
+        debug_print("Remote player has completed playback")
+        self.remote_completed = True
+        self._wake.set()  # Let the playback loop notice right away
+
+        # If both completed, return to connected state
+        if self.local_completed and self.remote_completed:
+            debug_print("Playback completed on both sides")
+            self.playback_completed = True
+            self.playback_status = "Completed"
+
+            # Wait a bit to show completion screen, then return to connected state
+            if self.state == PLAYING_MODE:
+                # Use a timer to avoid blocking in this thread
+                timer = threading.Timer(5.0, self.return_to_connected)
+                timer.daemon = True
+                timer.start()
+
+    def _on_start_playback(self, message):
+        """Master has signaled to start playback"""
+        debug_print("Received start playback signal from master")
+        if self.state == PLAYING_MODE:
+            # Start playback immediately when master says so
+            self.start_playback()
+
+    def _on_connect(self, message):
+        """Handle a connection request (master side)"""
+        if self.selected_role != 0:
             return
-        
-        # Handle connection messages
-        if msg_type == MSG_CONNECT:
-            # Handle connection request
-            if self.selected_role == 0:  # Master
-                # Check if track hashes match
-                client_hash = message.get("track_hash", "")
-                client_id = message.get("slave_id", "unknown")
-                client_ip = message.get("slave_ip", "unknown")
-                
-                debug_print(f"Got connection message from slave {client_id} at {client_ip}")
-                
-                if client_hash != self.track_hash:
-                    # Tracks don't match
-                    self.send_message({
-                        "type": MSG_ERROR,
-                        "message": "Track files don't match"
-                    })
-                else:
-                    # Confirm connection
-                    self.send_message({
-                        "type": MSG_CONFIRM,
-                        "track_name": self.track_name,
-                        "master_instrument": self.local_instrument,
-                        "slave_instrument": self.remote_instrument,
-                        "master_ip": self.local_ip
-                    })
-                    
-                    self.connection_status = f"Connected to slave {client_id}"
-                    
-        elif msg_type == MSG_CONFIRM:
-            # Handle connection confirmation
-            self.track_name = message.get("track_name", "Unknown")
-            # Get instrument assignments if provided
-            master_instrument = message.get("master_instrument")
-            slave_instrument = message.get("slave_instrument")
-            master_ip = message.get("master_ip", "unknown")
-            
-            if master_instrument is not None and slave_instrument is not None:
-                if self.selected_role == 1:  # Slave
-                    self.local_instrument = slave_instrument
-                    self.remote_instrument = master_instrument
-                    
-            debug_print(f"Connection confirmed with track: {self.track_name} from {master_ip}")
-            
-        elif msg_type == MSG_ERROR:
-            # Handle error message
-            error_msg = message.get('message', 'Unknown error')
-            debug_print(f"Error message received: {error_msg}")
-            self.connection_status = f"Error: {error_msg}"
+
+        # Check if track hashes match
+        client_hash = message.get("track_hash", "")
+        client_id = message.get("slave_id", "unknown")
+        client_ip = message.get("slave_ip", "unknown")
+
+        debug_print(f"Got connection message from slave {client_id} at {client_ip}")
+
+        if client_hash != self.track_hash:
+            # Tracks don't match
+            self.send_message({
+                "type": MSG_ERROR,
+                "message": "Track files don't match"
+            })
+        else:
+            # Confirm connection
+            self.send_message({
+                "type": MSG_CONFIRM,
+                "track_name": self.track_name,
+                "master_instrument": self.local_instrument,
+                "slave_instrument": self.remote_instrument,
+                "master_ip": self.local_ip
+            })
+
+            self.connection_status = f"Connected to slave {client_id}"
+
+    def _on_confirm(self, message):
+        """Handle connection confirmation (slave side)"""
+        self.track_name = message.get("track_name", "Unknown")
+        self._refresh_static_labels()
+        # Get instrument assignments if provided
+        master_instrument = message.get("master_instrument")
+        slave_instrument = message.get("slave_instrument")
+        master_ip = message.get("master_ip", "unknown")
+
+        if master_instrument is not None and slave_instrument is not None:
+            if self.selected_role == 1:  # Slave
+                self.local_instrument = slave_instrument
+                self.remote_instrument = master_instrument
+
+        debug_print(f"Connection confirmed with track: {self.track_name} from {master_ip}")
+
+    def _on_error(self, message):
+        """Handle an error message from the peer"""
+        error_msg = message.get('message', 'Unknown error')
+        debug_print(f"Error message received: {error_msg}")
+        self.connection_status = f"Error: {error_msg}"
     
     def start_heartbeat(self):
-        """Start a heartbeat thread to keep the connection alive"""
-        self.heartbeat_running = True
-        self.heartbeat_thread = threading.Thread(target=self.send_heartbeats)
-        self.heartbeat_thread.daemon = True
-        self.heartbeat_thread.start()
-        debug_print("Started heartbeat thread")
+        """Enable heartbeats; the connection handler's selector loop sends them.
 
-    def send_heartbeats(self):
-        """Send periodic heartbeats to keep the connection alive"""
-        try:
-            while self.heartbeat_running and self.connection_active:
-                # Send a heartbeat every 5 seconds
-                heartbeat = {
-                    "type": "ping",
-                    "timestamp": time.time()
-                }
-                self.send_message(heartbeat)
-                
-                # Sleep for 5 seconds
-                for _ in range(10):  # Check every 0.5 seconds if we should stop
-                    if not self.heartbeat_running or not self.connection_active:
-                        break
-                    time.sleep(0.5)
-                    
-        except Exception as e:
-            debug_print(f"Heartbeat error: {e}")
-        finally:
-            debug_print("Heartbeat thread ending")
+        No dedicated thread anymore - the handler caps its select timeout
+        at the next heartbeat deadline and pings when it passes, so
+        enabling keepalives is just a flag flip.
+        """
+        self.heartbeat_running = True
+        debug_print("Heartbeats enabled on connection loop")
     
     def calculate_track_hash(self, track_content):
-        """Calculate a hash of the track file for validation"""
-        return hashlib.md5(track_content.encode()).hexdigest()
+        """Calculate a hash of the track file for validation.
+
+        BLAKE2b with an 8-byte digest beats SHA-256 on small inputs and
+        emits exactly the 16 hex chars the discovery protocol sends - no
+        wasted digest bytes, computed once per track load. Accepts raw
+        bytes so file content is hashed without a decode/encode round-trip.
+        """
+        if isinstance(track_content, str):
+            track_content = track_content.encode()
+        return hashlib.blake2b(track_content, digest_size=8).hexdigest()
+
+    def _build_song_arrays(self):
+        """Sort the song and build column arrays over its timing fields.
+
+        Keeping start times in a contiguous float32 array lets the
+        playback loop binary-search the current window with
+        np.searchsorted instead of touching every note dict per tick.
+        """
+        # attrgetter runs the key in C; a Python lambda would re-enter
+        # the interpreter once per comparison key
+        self.parsed_song_data.sort(key=operator.attrgetter('start_time'))
+        count = len(self.parsed_song_data)
+        # fromiter with a known count fills the arrays directly, without
+        # building throwaway Python lists first
+        self._note_starts = np.fromiter(
+            (n.start_time for n in self.parsed_song_data), dtype=np.float32, count=count)
+        self._note_durations = np.fromiter(
+            (n.duration for n in self.parsed_song_data), dtype=np.float32, count=count)
+        # Piano-roll row indices and instrument ids as columns too, so
+        # the note display can compute a window's geometry in one
+        # vectorized pass instead of per-note Python math
+        self._note_indices = np.fromiter(
+            (NOTE_INDEX.get(n.note, 0) for n in self.parsed_song_data),
+            dtype=np.int32, count=count)
+        self._note_instruments = np.fromiter(
+            (n.instrument for n in self.parsed_song_data), dtype=np.int32, count=count)
+        # Precompute when the last note ends so playback setup never has
+        # to rescan the song
+        self._song_end_time = float((self._note_starts + self._note_durations).max()) if count else 0.0
+
+    def _parse_or_restore(self, content):
+        """Parse track content, reusing the cached result for a known hash"""
+        cached = self._track_cache.get(self.track_hash)
+        if cached is not None:
+            (self.parsed_song_data, self._note_starts,
+             self._note_durations, self._note_indices,
+             self._note_instruments, self._song_end_time) = cached
+        else:
+            default_instrument = INSTRUMENTS["PIANO"]
+            self.parsed_song_data = [
+                Note(n['Note'], n['Octave'], n['Duration'], n['Volume'],
+                     n.get('Instrument', default_instrument), n['Start Time'])
+                for n in parse_music_data(content)
+            ]
+            self._build_song_arrays()
+            self._track_cache[self.track_hash] = (
+                self.parsed_song_data, self._note_starts,
+                self._note_durations, self._note_indices,
+                self._note_instruments, self._song_end_time)
+        self._refresh_static_labels()
+
+    def _refresh_static_labels(self):
+        """Re-format the label strings that only change on track load.
+
+        The screens draw these every frame; building the strings here
+        means the draw calls hand a stable string to the render caches
+        instead of re-running identical f-string formatting per frame.
+        """
+        self._id_label = f"Your ID: {self.id}"
+        self._track_label = f"Current Track: {self.track_name}"
+        self._notes_label = f"Notes in track: {len(self.parsed_song_data)}"
+        self._hash_label = f"Track Hash: {self.track_hash[:16]}..."
     
     def load_track(self, filename="track.txt"):
         """Load a track file"""
         try:
             debug_print(f"Attempting to load track from {filename}")
-            # First try to load from the file
-            with open(filename, "r") as f:
-                content = f.read().strip()
-                
-            if not content:
+            # Read raw bytes so hashing needs no re-encode round-trip;
+            # decode once for the parser
+            with open(filename, "rb") as f:
+                content_bytes = f.read().strip()
+
+            if not content_bytes:
                 raise ValueError("Track file is empty")
-                
+
+            content = content_bytes.decode()
             self.track_content = content
             self.track_name = os.path.basename(filename)
-            self.track_hash = self.calculate_track_hash(content)
+            self.track_hash = self.calculate_track_hash(content_bytes)
             debug_print(f"Successfully loaded track: {self.track_name} with hash: {self.track_hash}")
             
-            # Parse the track data
+            # Parse the track data (or reuse the cached parse for an
+            # unchanged file)
             self.song_data = content
-            self.parsed_song_data = parse_music_data(content)
+            self._parse_or_restore(content)
             debug_print(f"Parsed {len(self.parsed_song_data)} notes from track")
             
             # Print first few notes for debugging
             if self.parsed_song_data:
                 for i, note in enumerate(self.parsed_song_data[:3]):
-                    debug_print(f"Note {i}: {note['Note']}{note['Octave']} at time {note['Start Time']}, inst: {note.get('Instrument', 0)}")
+                    debug_print(f"Note {i}: {note.note}{note.octave} at time {note.start_time}, inst: {note.instrument}")
             
             return True
         except Exception as e:
@@ -1006,17 +1527,17 @@ class MusicConnection:
             content = FALLBACK_TRACK
             self.track_content = content
             self.track_name = "fallback_track.txt"
-            self.track_hash = self.calculate_track_hash(content)
+            self.track_hash = self.calculate_track_hash(FALLBACK_TRACK_BYTES)
             
             # Parse the fallback track
             self.song_data = content
-            self.parsed_song_data = parse_music_data(content)
+            self._parse_or_restore(content)
             debug_print(f"Parsed {len(self.parsed_song_data)} notes from fallback track")
             
             # Print first few notes for debugging
             if self.parsed_song_data:
                 for i, note in enumerate(self.parsed_song_data[:3]):
-                    debug_print(f"Note {i}: {note['Note']}{note['Octave']} at time {note['Start Time']}, inst: {note.get('Instrument', 0)}")
+                    debug_print(f"Note {i}: {note.note}{note.octave} at time {note.start_time}, inst: {note.instrument}")
             
             # Save fallback to track.txt for consistent hash
             try:
@@ -1044,26 +1565,15 @@ class MusicConnection:
         self.playback_completed = False
         self.local_completed = False
         self.remote_completed = False
-        self.played_notes = []
-        self.upcoming_notes = []
-        
-        # Calculate the maximum song time for display
-        self.max_song_time = 0
-        for note in self.parsed_song_data:
-            end_time = note['Start Time'] + note['Duration']
-            if end_time > self.max_song_time:
-                self.max_song_time = end_time
-        
-        # Make sure we have a reasonable max_song_time (at least 10 seconds)
-        if self.max_song_time < 10:
-            self.max_song_time = 10
-        
-        # Add a buffer to the end
-        self.max_song_time += 2
-                
-        # Sort notes by start time for playback
-        self.parsed_song_data.sort(key=lambda x: x['Start Time'])
-        
+        self.played_notes.clear()
+        self._jitter_buf.clear()
+        self._upcoming_window = None
+
+        # The song end time is precomputed at load; clamp to a reasonable
+        # minimum (10s) and add a buffer to the end
+        self.max_song_time = max(self._song_end_time, 10) + 2
+
+
         # Update state
         self.state = PLAYING_MODE
         self.playback_status = "Waiting for remote player..."
@@ -1084,28 +1594,31 @@ class MusicConnection:
         return True
     
     def update_upcoming_notes(self, current_time):
-        """Update the list of upcoming notes based on current time"""
-        upcoming = []
-        for note in self.parsed_song_data:
-            # If the note hasn't been played yet and is coming up
-            if note['Start Time'] > current_time and note['Start Time'] < current_time + 5:
-                upcoming.append(note)
-                if len(upcoming) >= 10:  # Limit to 10 upcoming notes
-                    break
-        
-        self.upcoming_notes = upcoming
-    
+        """Update the index window of upcoming notes for the display"""
+        # Binary-search the sorted start times for notes in the next 5s
+        # window instead of scanning the whole song; draw_notes reads
+        # the column arrays directly through this window
+        i0 = int(np.searchsorted(self._note_starts, current_time, side='right'))
+        i1 = int(np.searchsorted(self._note_starts, current_time + 5, side='left'))
+        self._upcoming_window = (i0, min(i1, i0 + 10))  # Limit to 10 upcoming notes
+
+    def drain_jitter_buffer(self):
+        """Surface buffered remote note events whose delay has elapsed"""
+        now = time.monotonic()
+        while self._jitter_buf and self._jitter_buf[0][0] <= now:
+            _, note = self._jitter_buf.popleft()
+            self.played_notes.append(note)
+
     def start_playback(self):
         """Start the actual playback"""
         debug_print("Starting playback")
         self.playback_status = "Playing..."
         self.start_time = time.time()
         
-        # Start the playback thread
+        # Start the playback loop on the pool
         self.playback_running = True
-        playback_thread = threading.Thread(target=self.playback_loop)
-        playback_thread.daemon = True
-        playback_thread.start()
+        self._wake.clear()
+        self._executor.submit(self.playback_loop)
         
         # If we're the master, tell the slave to start
         if self.selected_role == 0:
@@ -1118,12 +1631,13 @@ class MusicConnection:
         try:
             debug_print("Playback loop started")
             
-            # Get a copy of the song data to avoid thread issues
+            # Get a copy of the song data to avoid thread issues; it is
+            # already sorted by start time and aligned with _note_starts
             song_data = list(self.parsed_song_data)
-            
-            # Initialize list of notes that haven't been played yet
-            pending_notes = list(song_data)
-            
+
+            # Index of the first note that hasn't been played yet
+            next_note_idx = 0
+
             # Main playback loop
             while self.playback_running and not self.playback_completed:
                 # Get current time relative to start
@@ -1132,43 +1646,35 @@ class MusicConnection:
                 
                 # Update the upcoming notes view
                 self.update_upcoming_notes(current_time)
-                
-                # Find notes to play at this time
-                notes_to_play = []
-                remaining_notes = []
-                
-                for note in pending_notes:
-                    # If the note should be played now
-                    if note['Start Time'] <= current_time:
-                        notes_to_play.append(note)
-                    else:
-                        remaining_notes.append(note)
-                
-                # Update the pending notes list
-                pending_notes = remaining_notes
-                
-                # Play the notes that should sound now
-                for note in notes_to_play:
-                    note_name = note['Note']
-                    octave = note['Octave']
-                    duration = note['Duration']
-                    volume = note['Volume']
-                    instrument = note.get('Instrument', INSTRUMENTS["PIANO"])
+
+                # Surface remote note events whose jitter delay has passed
+                self.drain_jitter_buffer()
+
+                # All notes due now form a contiguous slice of the sorted
+                # song, so one binary search replaces the per-note scan
+                due_idx = int(np.searchsorted(self._note_starts, current_time, side='right'))
+
+                # Play the notes that should sound now, advancing the
+                # cursor in place - no per-tick slice or list rebuild
+                for i in range(next_note_idx, due_idx):
+                    note = song_data[i]
+                    note_name = note.note
+                    octave = note.octave
+                    duration = note.duration
+                    volume = note.volume
+                    instrument = note.instrument
                     
                     # Only play notes for our instrument
                     if instrument == self.local_instrument:
-                        debug_print(f"Playing note {note_name}{octave} with {INSTRUMENT_NAMES[instrument]}")
+                        if DEBUG:
+                            debug_print(f"Playing note {note_name}{octave} with {INSTRUMENT_NAMES[instrument]}")
                         # Play the sound locally
                         play_note(note_name, octave, duration, volume, 0.5, instrument)
                         
-                        # Send note play message to remote player (just for visualization)
-                        self.send_message({
-                            "type": MSG_NOTE_PLAYED,
-                            "note": note_name,
-                            "octave": octave,
-                            "instrument": instrument,
-                            "start_time": current_time
-                        })
+                        # Queue note play message for the remote player
+                        # (just for visualization); flushed once per tick
+                        self.send_note_event(note_name, octave, instrument,
+                                             current_time, flush=False)
                         
                         # Add to played notes for visualization
                         self.played_notes.append({
@@ -1177,9 +1683,14 @@ class MusicConnection:
                             'instrument': instrument,
                             'time': current_time
                         })
-                
+
+                next_note_idx = max(next_note_idx, due_idx)
+
+                # Chord notes queued this tick go out as one segment
+                self.flush_note_events()
+
                 # Check if we're finished
-                if not pending_notes and current_time > self.max_song_time:
+                if next_note_idx >= len(song_data) and current_time > self.max_song_time:
                     debug_print("Playback completed")
                     self.local_completed = True
                     self.send_message({
@@ -1195,9 +1706,19 @@ class MusicConnection:
                     
                     break
                 
-                # Small sleep to prevent CPU hogging
-                time.sleep(0.01)
-                
+                # Sleep until the next note is due (or a buffered remote
+                # event matures), bounded so progress display stays fresh.
+                # A state change sets _wake to interrupt the wait early
+                delay = 0.1
+                if next_note_idx < len(song_data):
+                    delay = min(delay, float(self._note_starts[next_note_idx])
+                                - (time.time() - self.start_time))
+                if self._jitter_buf:
+                    delay = min(delay, self._jitter_buf[0][0] - time.monotonic())
+                if delay > 0:
+                    self._wake.wait(timeout=delay)
+                    self._wake.clear()
+
         except Exception as e:
             debug_print(f"Playback error: {e}")
             self.playback_status = f"Error: {e}"
@@ -1209,14 +1730,17 @@ class MusicConnection:
         if self.state == PLAYING_MODE:
             self.state = CONNECTION_ACTIVE
             self.playback_status = "Ready"
-            self.played_notes = []
-            self.upcoming_notes = []
+            self.played_notes.clear()
+            self._jitter_buf.clear()
+            self._upcoming_window = None
+            self._wake.set()  # Interrupt any pending playback sleep
             debug_print("Returned to connected state")
     
     def close_sockets(self):
         """Close all socket connections"""
         debug_print("Closing all sockets")
-        
+        self._active_sock = None
+
         if hasattr(self, 'socket') and self.socket:
             try:
                 self.socket.close()
@@ -1244,7 +1768,14 @@ class MusicConnection:
             except:
                 pass
             self.response_socket = None
-    
+
+        if hasattr(self, 'slave_response_socket') and self.slave_response_socket:
+            try:
+                self.slave_response_socket.close()
+            except:
+                pass
+            self.slave_response_socket = None
+
     def cleanup(self):
         """Clean up network resources"""
         debug_print("Cleaning up network resources")
@@ -1256,37 +1787,84 @@ class MusicConnection:
             self.heartbeat_running = False
         if hasattr(self, 'playback_running'):
             self.playback_running = False
-        
-        # Give threads a moment to respond to the stop signal
-        time.sleep(0.2)
+        self._wake.set()
+        try:
+            os.write(self._shutdown_pipe_w, b"x")
+        except OSError:
+            pass
+
+        # Wait (briefly) for the worker threads to notice the stop
+        # signal, returning as soon as they do instead of a fixed stall
+        self._await_task(self.connection_task, timeout=0.2)
+        self._await_task(self.discovery_task, timeout=0.2)
         
         # Close all sockets
         self.close_sockets()
     
+    def _slave_ids(self):
+        """Snapshot of the slave roster ids, rebuilt only when it changed"""
+        if self._slave_ids_revision != active_slaves_revision:
+            self._slave_ids_snapshot = list(active_slaves)
+            self._slave_ids_revision = active_slaves_revision
+        return self._slave_ids_snapshot
+
+    def _prep_instructions(self, strings, y_start, line_height=30):
+        """Pre-render centered instruction lines as (surface, position) pairs"""
+        prepared = []
+        y_pos = y_start
+        for text in strings:
+            surf = self.small_font.render(text, True, (200, 200, 200), BG_COLOR)
+            prepared.append((surf, (WIDTH // 2 - surf.get_width() // 2, y_pos)))
+            y_pos += line_height
+        return prepared
+
+    def _render_text_uncached(self, font, text, color, bg=BG_COLOR):
+        """Render text to a surface; only called on _render_text cache misses.
+
+        Passing the background color makes the rendered surface opaque,
+        so blitting it is a straight pixel copy instead of a per-glyph
+        alpha blend. Callers drawing over anything other than the flat
+        BG_COLOR must pass the matching bg (it is part of the cache key).
+        """
+        return font.render(text, True, color, bg)
+
+    def _render_centered_uncached(self, font, text, color, y, bg=BG_COLOR):
+        """Render text with its precomputed centered position.
+
+        Only called on _render_centered cache misses; returns a
+        (surface, (x, y)) pair ready to blit.
+        """
+        surf = self._render_text(font, text, color, bg)
+        return surf, ((WIDTH - surf.get_width()) // 2, y)
+
     def draw_button(self, text, position, size):
-        """Draw a button with text"""
-        # Draw button background
-        rect = pygame.Rect(position, size)
-        pygame.draw.rect(self.screen, BUTTON_BG, rect, border_radius=10)
-        
-        # Draw border
-        border_width = 2
-        pygame.draw.rect(self.screen, BUTTON_BORDER, rect, width=border_width, border_radius=10)
-        
-        # Draw text
-        text_surface = self.font.render(text, True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(
-            center=(position[0] + size[0]//2, position[1] + size[1]//2)
-        )
-        self.screen.blit(text_surface, text_rect)
-        
-        return rect
+        """Draw a button with text.
+
+        The composed surface (background, border, label) is cached per
+        (text, size), so repeat frames pay one blit instead of two
+        rounded-rect fills plus a text blit. Buttons only appear over
+        the flat BG_COLOR, so the corners outside the rounding are
+        filled with it and the surface stays opaque.
+        """
+        surf = self._button_cache.get((text, size))
+        if surf is None:
+            surf = pygame.Surface(size)
+            surf.fill(BG_COLOR)
+            rect = pygame.Rect((0, 0), size)
+            pygame.draw.rect(surf, BUTTON_BG, rect, border_radius=10)
+            pygame.draw.rect(surf, BUTTON_BORDER, rect, width=2, border_radius=10)
+            text_surface = self._render_text(self.font, text, TEXT_COLOR, BUTTON_BG)
+            surf.blit(text_surface,
+                      text_surface.get_rect(center=(size[0] // 2, size[1] // 2)))
+            self._button_cache[(text, size)] = surf
+
+        self.screen.blit(surf, position)
+        return pygame.Rect(position, size)
         
     def draw_role_selection(self):
         """Draw the role selection screen"""
         # Draw title
-        title = self.large_font.render("Select Connection Role", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
+        self.screen.blit(*self._render_centered(self.large_font, "Select Connection Role", TEXT_COLOR, 100))
         
         # Draw role description
         if self.selected_role == 0:
@@ -1304,13 +1882,11 @@ class MusicConnection:
         
         y_pos = 180
         for line in desc:
-            desc_text = self.font.render(line, True, (200, 200, 200))
-            self.screen.blit(desc_text, (WIDTH//2 - desc_text.get_width()//2, y_pos))
+            self.screen.blit(*self._render_centered(self.font, line, (200, 200, 200), y_pos))
             y_pos += 40
         
         # Display network IP
-        ip_text = self.font.render(f"Your IP Address: {self.local_ip}", True, ID_YELLOW)
-        self.screen.blit(ip_text, (WIDTH//2 - ip_text.get_width()//2, y_pos + 20))
+        self.screen.blit(*self._render_centered(self.font, f"Your IP Address: {self.local_ip}", ID_YELLOW, y_pos + 20))
         
         # Draw buttons
         master_btn = self.draw_button(
@@ -1331,65 +1907,39 @@ class MusicConnection:
             # Highlight selected button
             pygame.draw.rect(self.screen, (0, 100, 255), slave_btn, width=4, border_radius=10)
         
-        # Draw instructions
-        instructions = [
-            "Press 'A' to switch between options",
-            "Press 'Enter' to select",
-            "Press 'Esc' to return to main menu"
-        ]
-        
-        y_pos = HEIGHT - 150
-        for instr in instructions:
-            instr_text = self.small_font.render(instr, True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, y_pos))
-            y_pos += 30
+        # Draw the pre-rendered instructions
+        for surf, pos in self._role_instr:
+            self.screen.blit(surf, pos)
     
     def draw_master_screen(self):
         """Draw the master connection screen"""
         # Draw title
-        title = self.large_font.render("Master Mode", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
-        
-        # Draw status
-        status_color = STATUS_RED
-        if self.connection_status == "Disconnected":
-            status_color = STATUS_RED
-        elif "Error" in self.connection_status:
-            status_color = STATUS_RED
-        elif "Connected" in self.connection_status:
-            status_color = STATUS_GREEN
-        else:
-            status_color = STATUS_ORANGE
-            
-        status = self.font.render(f"Status: {self.connection_status}", True, status_color)
-        self.screen.blit(status, (WIDTH//2 - status.get_width()//2, 180))
+        self.screen.blit(*self._render_centered(self.large_font, "Master Mode", TEXT_COLOR, 100))
+        
+        # Draw status (color memoized per status string)
+        self.screen.blit(*self._render_centered(
+            self.font, f"Status: {self.connection_status}",
+            master_status_color(self.connection_status), 180))
         
         # Draw your ID
-        id_text = self.font.render(f"Your ID: {self.id}", True, TEXT_COLOR)
-        self.screen.blit(id_text, (WIDTH//2 - id_text.get_width()//2, 230))
+        self.screen.blit(*self._render_centered(self.font, self._id_label, TEXT_COLOR, 230))
         
         # Draw your IP
-        ip_text = self.font.render(f"Your IP: {self.local_ip}", True, ID_YELLOW)
-        self.screen.blit(ip_text, (WIDTH//2 - ip_text.get_width()//2, 270))
+        self.screen.blit(*self._render_centered(self.font, f"Your IP: {self.local_ip}", ID_YELLOW, 270))
         
         # Draw instrument info
-        local_instr = self.font.render(f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(local_instr, (WIDTH//2 - local_instr.get_width()//2, 320))
+        self.screen.blit(*self._render_centered(self.font, f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", TEXT_COLOR, 320))
         
-        remote_instr = self.font.render(f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(remote_instr, (WIDTH//2 - remote_instr.get_width()//2, 360))
+        self.screen.blit(*self._render_centered(self.font, f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", TEXT_COLOR, 360))
         
         # Draw track info
-        track_text = self.font.render(f"Current Track: {self.track_name}", True, TEXT_COLOR)
-        self.screen.blit(track_text, (WIDTH//2 - track_text.get_width()//2, 400))
+        self.screen.blit(*self._render_centered(self.font, self._track_label, TEXT_COLOR, 400))
         
         # Draw track note count
-        notes_text = self.small_font.render(f"Notes in track: {len(self.parsed_song_data)}", True, (200, 200, 200))
-        self.screen.blit(notes_text, (WIDTH//2 - notes_text.get_width()//2, 440))
+        self.screen.blit(*self._render_centered(self.small_font, self._notes_label, (200, 200, 200), 440))
         
         # Draw track hash for debugging
-        hash_text = self.small_font.render(f"Track Hash: {self.track_hash[:16]}...", True, (150, 150, 150))
-        self.screen.blit(hash_text, (WIDTH//2 - hash_text.get_width()//2, 470))
+        self.screen.blit(*self._render_centered(self.small_font, self._hash_label, (150, 150, 150), 470))
         
         # Draw buttons
         scan_btn = self.draw_button(
@@ -1404,68 +1954,41 @@ class MusicConnection:
             (300, 60)
         )
         
-        # Draw instructions
-        instructions = [
-            "Press 'S' to scan for slaves",
-            "Press 'L' to load track",
-            "Press 'Esc' to return to role selection"
-        ]
-        
-        y_pos = HEIGHT - 120
-        for instr in instructions:
-            instr_text = self.small_font.render(instr, True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, y_pos))
-            y_pos += 30
+        # Draw the pre-rendered instructions
+        for surf, pos in self._master_instr:
+            self.screen.blit(surf, pos)
     
     def draw_slave_screen(self):
         """Draw the slave connection screen"""
         # Draw title
-        title = self.large_font.render("Slave Mode", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
-        
-        # Draw status
-        status_color = STATUS_ORANGE
-        if "Discovered" in self.connection_status:
-            status_color = STATUS_ORANGE
-        elif "Connected" in self.connection_status:
-            status_color = STATUS_GREEN
-        elif self.connection_status == "Disconnected" or "Error" in self.connection_status:
-            status_color = STATUS_RED
-        elif "Limited" in self.connection_status:
-            status_color = (255, 200, 0)  # Darker orange for limited discovery
-            
-        status = self.font.render(f"Status: {self.connection_status}", True, status_color)
-        self.screen.blit(status, (WIDTH//2 - status.get_width()//2, 180))
+        self.screen.blit(*self._render_centered(self.large_font, "Slave Mode", TEXT_COLOR, 100))
+        
+        # Draw status (color memoized per status string)
+        self.screen.blit(*self._render_centered(
+            self.font, f"Status: {self.connection_status}",
+            slave_status_color(self.connection_status), 180))
         
         # Draw your ID
-        id_text = self.large_font.render(f"Your ID: {self.id}", True, ID_YELLOW)
-        self.screen.blit(id_text, (WIDTH//2 - id_text.get_width()//2, 240))
+        self.screen.blit(*self._render_centered(self.large_font, self._id_label, ID_YELLOW, 240))
         
         # Draw your IP
-        ip_text = self.font.render(f"Your IP: {self.local_ip}", True, ID_YELLOW)
-        self.screen.blit(ip_text, (WIDTH//2 - ip_text.get_width()//2, 300))
+        self.screen.blit(*self._render_centered(self.font, f"Your IP: {self.local_ip}", ID_YELLOW, 300))
         
-        info_text = self.font.render("Masters will see this ID when scanning", True, (200, 200, 200))
-        self.screen.blit(info_text, (WIDTH//2 - info_text.get_width()//2, 340))
+        self.screen.blit(*self._render_centered(self.font, "Masters will see this ID when scanning", (200, 200, 200), 340))
         
         # Draw instrument info
-        local_instr = self.font.render(f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(local_instr, (WIDTH//2 - local_instr.get_width()//2, 390))
+        self.screen.blit(*self._render_centered(self.font, f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", TEXT_COLOR, 390))
         
-        remote_instr = self.font.render(f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(remote_instr, (WIDTH//2 - remote_instr.get_width()//2, 430))
+        self.screen.blit(*self._render_centered(self.font, f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", TEXT_COLOR, 430))
         
         # Draw track info
-        track_text = self.font.render(f"Current Track: {self.track_name}", True, TEXT_COLOR)
-        self.screen.blit(track_text, (WIDTH//2 - track_text.get_width()//2, 480))
+        self.screen.blit(*self._render_centered(self.font, self._track_label, TEXT_COLOR, 480))
         
         # Draw track note count
-        notes_text = self.small_font.render(f"Notes in track: {len(self.parsed_song_data)}", True, (200, 200, 200))
-        self.screen.blit(notes_text, (WIDTH//2 - notes_text.get_width()//2, 510))
+        self.screen.blit(*self._render_centered(self.small_font, self._notes_label, (200, 200, 200), 510))
         
         # Draw track hash for debugging
-        hash_text = self.small_font.render(f"Track Hash: {self.track_hash[:16]}...", True, (150, 150, 150))
-        self.screen.blit(hash_text, (WIDTH//2 - hash_text.get_width()//2, 540))
+        self.screen.blit(*self._render_centered(self.small_font, self._hash_label, (150, 150, 150), 540))
         
         # Draw load button
         load_btn = self.draw_button(
@@ -1474,55 +1997,36 @@ class MusicConnection:
             (300, 60)
         )
         
-        # Draw instructions
-        instructions = [
-            "Press 'L' to load track",
-            "Press 'Esc' to return to role selection"
-        ]
-        
-        y_pos = HEIGHT - 100
-        for instr in instructions:
-            instr_text = self.small_font.render(instr, True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, y_pos))
-            y_pos += 30
+        # Draw the pre-rendered instructions
+        for surf, pos in self._slave_instr:
+            self.screen.blit(surf, pos)
             
     def draw_slave_select_screen(self):
         """Draw the slave selection screen"""
         # Draw title
-        title = self.large_font.render("Select a Slave", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
-        
-        # Draw status
-        status_color = STATUS_ORANGE
-        if "Error" in self.connection_status:
-            status_color = STATUS_RED
-        elif "Connected" in self.connection_status:
-            status_color = STATUS_GREEN
-        elif "timeout" in self.connection_status.lower():
-            status_color = STATUS_RED
+        self.screen.blit(*self._render_centered(self.large_font, "Select a Slave", TEXT_COLOR, 100))
         
-        status = self.font.render(f"Status: {self.connection_status}", True, status_color)
-        self.screen.blit(status, (WIDTH//2 - status.get_width()//2, 160))
+        # Draw status (color memoized per status string)
+        self.screen.blit(*self._render_centered(
+            self.font, f"Status: {self.connection_status}",
+            select_status_color(self.connection_status), 160))
         
         # Draw IP info
-        ip_text = self.font.render(f"Your IP: {self.local_ip}", True, ID_YELLOW)
-        self.screen.blit(ip_text, (WIDTH//2 - ip_text.get_width()//2, 200))
-        
-        # Get available slaves - use a copy to avoid thread issues
-        global active_slaves
-        slave_ids = list(active_slaves.keys())
+        self.screen.blit(*self._render_centered(self.font, f"Your IP: {self.local_ip}", ID_YELLOW, 200))
         
+        # Get available slaves - snapshot rebuilt only when the roster
+        # revision moves, not on every frame
+        slave_ids = self._slave_ids()
+
         # Debug display
-        debug_text = self.small_font.render(f"Active slaves: {len(slave_ids)}", True, (100, 255, 100))
+        debug_text = self._render_text(self.small_font, f"Active slaves: {len(slave_ids)}", (100, 255, 100))
         self.screen.blit(debug_text, (20, 10))
         
         if not slave_ids:
             # No slaves found
-            no_slaves_text = self.font.render("No slaves found. Make sure they are running in slave mode.", True, STATUS_RED)
-            self.screen.blit(no_slaves_text, (WIDTH//2 - no_slaves_text.get_width()//2, HEIGHT//2))
+            self.screen.blit(*self._render_centered(self.font, "No slaves found. Make sure they are running in slave mode.", STATUS_RED, HEIGHT//2))
             
-            net_info = self.small_font.render("Both computers must be on the same network with same track loaded", True, (200, 200, 200))
-            self.screen.blit(net_info, (WIDTH//2 - net_info.get_width()//2, HEIGHT//2 + 40))
+            self.screen.blit(*self._render_centered(self.small_font, "Both computers must be on the same network with same track loaded", (200, 200, 200), HEIGHT//2 + 40))
             
             # Draw retry button
             retry_btn = self.draw_button(
@@ -1533,8 +2037,7 @@ class MusicConnection:
         else:
             # Draw slave list
             list_y = 240
-            list_title = self.font.render("Available Slaves:", True, TEXT_COLOR)
-            self.screen.blit(list_title, (WIDTH//2 - list_title.get_width()//2, list_y))
+            self.screen.blit(*self._render_centered(self.font, "Available Slaves:", TEXT_COLOR, list_y))
             
             # Adjust selected index if out of bounds
             if self.selected_slave_index >= len(slave_ids):
@@ -1565,49 +2068,32 @@ class MusicConnection:
                     (400, 60)
                 )
         
-        # Draw instructions
-        instructions = [
-            "Up/Down to select a slave",
-            "Press 'Enter' to connect",
-            "Press 'R' to refresh list",
-            "Press 'Esc' to return"
-        ]
-        
-        y_pos = HEIGHT - 100
-        for instr in instructions:
-            instr_text = self.small_font.render(instr, True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, y_pos))
-            y_pos += 25
+        # Draw the pre-rendered instructions
+        for surf, pos in self._slave_select_instr:
+            self.screen.blit(surf, pos)
             
     def draw_active_connection(self):
         """Draw the active connection screen"""
         # Draw title
         role_text = "Master" if self.selected_role == 0 else "Slave"
-        title = self.large_font.render(f"Connected - {role_text} Mode", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 100))
+        self.screen.blit(*self._render_centered(self.large_font, f"Connected - {role_text} Mode", TEXT_COLOR, 100))
         
         # Draw connection info
-        status = self.font.render(f"Status: {self.connection_status}", True, STATUS_GREEN)
-        self.screen.blit(status, (WIDTH//2 - status.get_width()//2, 180))
+        self.screen.blit(*self._render_centered(self.font, f"Status: {self.connection_status}", STATUS_GREEN, 180))
         
         # Draw IP info
-        ip_text = self.font.render(f"Your IP: {self.local_ip}", True, ID_YELLOW)
-        self.screen.blit(ip_text, (WIDTH//2 - ip_text.get_width()//2, 220))
+        self.screen.blit(*self._render_centered(self.font, f"Your IP: {self.local_ip}", ID_YELLOW, 220))
         
         # Draw track info
-        track_text = self.font.render(f"Current Track: {self.track_name}", True, TEXT_COLOR)
-        self.screen.blit(track_text, (WIDTH//2 - track_text.get_width()//2, 260))
+        self.screen.blit(*self._render_centered(self.font, self._track_label, TEXT_COLOR, 260))
         
         # Draw track note count
-        notes_text = self.small_font.render(f"Notes in track: {len(self.parsed_song_data)}", True, (200, 200, 200))
-        self.screen.blit(notes_text, (WIDTH//2 - notes_text.get_width()//2, 290))
+        self.screen.blit(*self._render_centered(self.small_font, self._notes_label, (200, 200, 200), 290))
         
         # Draw instrument info
-        local_instr = self.font.render(f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(local_instr, (WIDTH//2 - local_instr.get_width()//2, 330))
+        self.screen.blit(*self._render_centered(self.font, f"Your Instrument: {INSTRUMENT_NAMES[self.local_instrument]}", TEXT_COLOR, 330))
         
-        remote_instr = self.font.render(f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", True, TEXT_COLOR)
-        self.screen.blit(remote_instr, (WIDTH//2 - remote_instr.get_width()//2, 370))
+        self.screen.blit(*self._render_centered(self.font, f"Remote Instrument: {INSTRUMENT_NAMES[self.remote_instrument]}", TEXT_COLOR, 370))
         
         # Draw "Start Playing" button
         play_btn = self.draw_button(
@@ -1617,86 +2103,71 @@ class MusicConnection:
         )
         
         # Draw network info
-        net_info = self.small_font.render("Connection established successfully between computers", True, (200, 200, 200))
-        self.screen.blit(net_info, (WIDTH//2 - net_info.get_width()//2, HEIGHT//2 + 130))
+        self.screen.blit(*self._render_centered(self.small_font, "Connection established successfully between computers", (200, 200, 200), HEIGHT//2 + 130))
         
-        # Draw instructions
-        instructions = [
-            "Press 'P' to start playing",
-            "Press 'Esc' to disconnect and return"
-        ]
-        
-        y_pos = HEIGHT - 100
-        for instr in instructions:
-            instr_text = self.small_font.render(instr, True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, y_pos))
-            y_pos += 30
+        # Draw the pre-rendered instructions
+        for surf, pos in self._connected_instr:
+            self.screen.blit(surf, pos)
     
     def draw_playing_screen(self):
         """Draw the playing screen with visual display of notes"""
+        # Text surfaces accumulate here and go out in one batched call
+        # at the end - one Python->C crossing instead of one per label
+        blit_list = []
+
         # Draw title
-        title = self.large_font.render("Playing Music", True, TEXT_COLOR)
-        self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 50))
-        
-        # Draw playback status
-        status_color = STATUS_GREEN if "Playing" in self.playback_status else STATUS_ORANGE
-        if "Error" in self.playback_status:
-            status_color = STATUS_RED
-        elif "Completed" in self.playback_status:
-            status_color = STATUS_GREEN
-            
-        status = self.font.render(f"Status: {self.playback_status}", True, status_color)
-        self.screen.blit(status, (WIDTH//2 - status.get_width()//2, 100))
-        
+        blit_list.append(self._render_centered(self.large_font, "Playing Music", TEXT_COLOR, 50))
+
+        # Draw playback status (color memoized per status string)
+        blit_list.append(self._render_centered(
+            self.font, f"Status: {self.playback_status}",
+            playback_status_color(self.playback_status), 100))
+
         # Draw time progress
-        progress_text = self.font.render(f"Time: {self.current_time:.2f}s / {self.max_song_time:.2f}s", True, TEXT_COLOR)
-        self.screen.blit(progress_text, (WIDTH//2 - progress_text.get_width()//2, 140))
-        
-        # Draw progress bar
-        progress_width = WIDTH - 200
-        progress_height = 20
-        progress_x = 100
-        progress_y = 180
-        
-        # Draw background
-        pygame.draw.rect(self.screen, (50, 50, 50), (progress_x, progress_y, progress_width, progress_height))
-        
-        # Draw progress
+        # Quantized to 0.1s so the string (and thus the cached surface)
+        # only changes 10 times a second instead of every frame
+        blit_list.append(self._render_centered(
+            self.font, f"Time: {self.current_time:.1f}s / {self.max_song_time:.1f}s",
+            TEXT_COLOR, 140))
+
+        # Draw progress bar into the preallocated rects; only the fill
+        # width mutates, and only when the pixel value actually moves.
+        # (Both rects still draw every frame - the screen is cleared.)
+        pygame.draw.rect(self.screen, (50, 50, 50), self._progress_bg_rect)
+
         if self.max_song_time > 0:
-            progress_percentage = min(1.0, self.current_time / self.max_song_time)
-            filled_width = int(progress_width * progress_percentage)
-            pygame.draw.rect(self.screen, (0, 200, 0), (progress_x, progress_y, filled_width, progress_height))
-        
-        # Draw divider line between instruments
+            filled_width = int(self._progress_bg_rect.width
+                               * min(1.0, self.current_time / self.max_song_time))
+            if filled_width != self._progress_fill_rect.width:
+                self._progress_fill_rect.width = filled_width
+            pygame.draw.rect(self.screen, (0, 200, 0), self._progress_fill_rect)
+        
+        # Blit the pre-baked stage band (section backgrounds, divider
+        # line, instrument labels) in one operation
         divider_y = HEIGHT//2
-        pygame.draw.line(self.screen, (100, 100, 100), (0, divider_y), (WIDTH, divider_y), 2)
-        
-        # Draw instrument labels
-        piano_label = self.font.render(f"Piano ({INSTRUMENT_NAMES[INSTRUMENTS['PIANO']]})", True, PIANO_COLOR)
-        guitar_label = self.font.render(f"Electro Guitar ({INSTRUMENT_NAMES[INSTRUMENTS['ELECTRO_GUITAR']]})", True, GUITAR_COLOR)
-        
-        # Position the labels
-        self.screen.blit(piano_label, (20, divider_y - 40))
-        self.screen.blit(guitar_label, (20, divider_y + 10))
-        
+        self.screen.blit(self._stage_surf, (0, self._stage_top))
+
         # Draw note visualizations
         self.draw_notes(divider_y)
-        
+
         # Draw instruments for this player
         if self.local_instrument == INSTRUMENTS["PIANO"]:
-            local_text = self.small_font.render("You are playing Piano parts", True, PIANO_COLOR)
-            self.screen.blit(local_text, (WIDTH - 250, divider_y - 40))
+            local_text = self._render_text(self.small_font, "You are playing Piano parts", PIANO_COLOR)
+            blit_list.append((local_text, (WIDTH - 250, divider_y - 40)))
         else:
-            local_text = self.small_font.render("You are playing Guitar parts", True, GUITAR_COLOR)
-            self.screen.blit(local_text, (WIDTH - 250, divider_y + 10))
-        
+            local_text = self._render_text(self.small_font, "You are playing Guitar parts", GUITAR_COLOR)
+            blit_list.append((local_text, (WIDTH - 250, divider_y + 10)))
+
         # Draw instructions
         if "Completed" in self.playback_status:
-            instr_text = self.font.render("Playback Completed! Press 'Esc' to return", True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, HEIGHT - 50))
+            blit_list.append(self._render_centered(
+                self.font, "Playback Completed! Press 'Esc' to return", (200, 200, 200), HEIGHT - 50))
         else:
-            instr_text = self.small_font.render("Press 'Esc' to stop playback and return", True, (200, 200, 200))
-            self.screen.blit(instr_text, (WIDTH//2 - instr_text.get_width()//2, HEIGHT - 30))
+            blit_list.append(self._render_centered(
+                self.small_font, "Press 'Esc' to stop playback and return", (200, 200, 200), HEIGHT - 30))
+
+        # One batched call for every text surface on this screen
+        self._blit_batch(blit_list)
     
     def draw_notes(self, divider_y):
         """Draw the piano roll display of notes"""
@@ -1712,69 +2183,80 @@ class MusicConnection:
         # Guitar section (below divider)
         guitar_y = divider_y + 50
         guitar_height = 120
-        
-        # Draw piano section background
-        pygame.draw.rect(self.screen, (40, 40, 60), (timeline_x, piano_y, timeline_width, piano_height))
-        
-        # Draw guitar section background
-        pygame.draw.rect(self.screen, (60, 40, 40), (timeline_x, guitar_y, timeline_width, guitar_height))
-        
+
+        # Hoisted loop invariants: row heights and the time-to-pixel
+        # scale are fixed for the whole frame
+        piano_row_h = piano_height / len(NOTE_NAMES)
+        guitar_row_h = guitar_height / len(NOTE_NAMES)
+        px_per_sec = timeline_width / self.max_song_time if self.max_song_time > 0 else 0
+
+        # Section backgrounds come pre-baked on the stage surface blitted
+        # by draw_playing_screen; only the moving parts paint here
+
         # Draw vertical timeline at current position
         if self.current_time > 0 and self.max_song_time > 0:
-            current_x = timeline_x + int((timeline_width / self.max_song_time) * self.current_time)
-            pygame.draw.line(self.screen, (255, 255, 0), 
-                            (current_x, piano_y - 10), 
+            current_x = timeline_x + int(px_per_sec * self.current_time)
+            pygame.draw.line(self.screen, (255, 255, 0),
+                            (current_x, piano_y - 10),
                             (current_x, guitar_y + guitar_height + 10), 3)
-        
+
+        # Age out notes older than the 5s visibility window: appends are
+        # in time order, so the stale entries are always at the head and
+        # the draw loop below only ever touches visible notes
+        cutoff = self.current_time - 5
+        played = self.played_notes
+        while played and played[0]['time'] <= cutoff:
+            played.popleft()
+
         # Draw played notes
-        for note in self.played_notes:
-            if note['time'] > self.current_time - 5:  # Only show recent notes
-                note_x = timeline_x + int((timeline_width / self.max_song_time) * note['time'])
-                note_width = 10  # Fixed width for played notes
-                
-                # Determine color and position based on instrument
-                if note['instrument'] == INSTRUMENTS["PIANO"]:
-                    # Draw in piano section
-                    # Vary y position based on the note
-                    note_index = list(FREQS.keys()).index(note['note'])
-                    note_y = piano_y + note_index * (piano_height / len(FREQS))
-                    
-                    pygame.draw.rect(self.screen, PIANO_COLOR, 
-                                    (note_x, note_y, note_width, note_height))
-                else:
-                    # Draw in guitar section
-                    note_index = list(FREQS.keys()).index(note['note'])
-                    note_y = guitar_y + note_index * (guitar_height / len(FREQS))
-                    
-                    pygame.draw.rect(self.screen, GUITAR_COLOR, 
-                                    (note_x, note_y, note_width, note_height))
-        
-        # Draw upcoming notes if we have song data
-        if self.upcoming_notes:
-            for note in self.upcoming_notes:
-                note_start = note['Start Time']
-                if note_start > self.current_time:  # Only draw upcoming notes
-                    note_x = timeline_x + int((timeline_width / self.max_song_time) * note_start)
-                    note_width = max(5, int((timeline_width / self.max_song_time) * note['Duration']))
-                    
-                    # Determine color and position based on instrument
-                    instrument = note.get('Instrument', INSTRUMENTS["PIANO"])
-                    if instrument == INSTRUMENTS["PIANO"]:
-                        # Draw in piano section - transparent to indicate upcoming
-                        note_index = list(FREQS.keys()).index(note['Note'])
-                        note_y = piano_y + note_index * (piano_height / len(FREQS))
-                        
-                        # Draw outline for upcoming notes
-                        pygame.draw.rect(self.screen, PIANO_COLOR, 
-                                        (note_x, note_y, note_width, note_height), 1)
-                    else:
-                        # Draw in guitar section - transparent to indicate upcoming
-                        note_index = list(FREQS.keys()).index(note['Note'])
-                        note_y = guitar_y + note_index * (guitar_height / len(FREQS))
-                        
-                        # Draw outline for upcoming notes
-                        pygame.draw.rect(self.screen, GUITAR_COLOR, 
-                                        (note_x, note_y, note_width, note_height), 1)
+        for note in played:
+            note_x = timeline_x + int(px_per_sec * note['time'])
+            note_width = 10  # Fixed width for played notes
+
+            # O(1) dict lookup instead of rebuilding and scanning the
+            # key list per note
+            note_index = NOTE_INDEX[note['note']]
+
+            # Determine color and position based on instrument
+            if note['instrument'] == INSTRUMENTS["PIANO"]:
+                # Draw in piano section; vary y position by note
+                note_y = piano_y + note_index * piano_row_h
+
+                pygame.draw.rect(self.screen, PIANO_COLOR,
+                                (note_x, note_y, note_width, note_height))
+            else:
+                # Draw in guitar section
+                note_y = guitar_y + note_index * guitar_row_h
+
+                pygame.draw.rect(self.screen, GUITAR_COLOR,
+                                (note_x, note_y, note_width, note_height))
+
+        # Draw upcoming notes straight from the song's column arrays:
+        # one vectorized pass computes the whole window's geometry,
+        # leaving only the outline rect calls in Python. The window is
+        # at most 10 notes, so a JIT-compiled kernel would add a
+        # dependency and compile stalls for math NumPy already handles
+        window = self._upcoming_window
+        if window and px_per_sec and window[1] > window[0]:
+            lo, hi = window
+            starts = self._note_starts[lo:hi]
+            visible = starts > self.current_time  # Only draw upcoming notes
+            if visible.any():
+                xs = (timeline_x + px_per_sec * starts[visible]).astype(np.int32)
+                widths = np.maximum(
+                    5, (px_per_sec * self._note_durations[lo:hi][visible]).astype(np.int32))
+                indices = self._note_indices[lo:hi][visible]
+                piano_mask = self._note_instruments[lo:hi][visible] == INSTRUMENTS["PIANO"]
+                ys = np.where(piano_mask,
+                              piano_y + indices * piano_row_h,
+                              guitar_y + indices * guitar_row_h).astype(np.int32)
+
+                # Outlined rects to indicate upcoming, colored per section
+                for x, y, w, is_piano in zip(xs.tolist(), ys.tolist(),
+                                             widths.tolist(), piano_mask.tolist()):
+                    pygame.draw.rect(self.screen,
+                                     PIANO_COLOR if is_piano else GUITAR_COLOR,
+                                     (x, y, w, note_height), 1)
     
     def handle_events(self):
         """Handle user input events"""
@@ -1792,13 +2274,19 @@ class MusicConnection:
                     elif self.state == SLAVE_SELECT:
                         # Return to master mode
                         self.discovery_running = False
-                        time.sleep(0.2)  # Give time for thread to clean up
+                        self._await_task(self.discovery_task, timeout=0.2)
                         self.state = MASTER_MODE
                         self.connection_status = "Disconnected"
                     elif self.state == CONNECTION_ACTIVE:
-                        # Disconnect and return to previous mode
+                        # Disconnect and return to previous mode; the
+                        # pipe write wakes the handler out of its select
+                        # so the wait below returns almost immediately
                         self.connection_active = False
-                        time.sleep(0.2)  # Give time for thread to clean up
+                        try:
+                            os.write(self._shutdown_pipe_w, b"x")
+                        except OSError:
+                            pass
+                        self._await_task(self.connection_task, timeout=0.2)
                         
                         if self.selected_role == 0:  # Master
                             self.state = MASTER_MODE
@@ -1868,9 +2356,8 @@ class MusicConnection:
                 
                 # Slave selection screen
                 elif self.state == SLAVE_SELECT:
-                    global active_slaves
-                    slave_ids = list(active_slaves.keys())
-                    
+                    slave_ids = self._slave_ids()
+
                     # Up/Down to navigate the list
                     if event.key == pygame.K_UP:
                         if slave_ids:
@@ -1890,8 +2377,9 @@ class MusicConnection:
                     elif event.key == pygame.K_r:
                         # Clear and restart scan
                         self.discovery_running = False
-                        time.sleep(0.2)  # Give time for thread to clean up
+                        self._await_task(self.discovery_task, timeout=0.2)
                         active_slaves.clear()
+                        bump_slaves_revision()
                         self.start_server()
                 
                 # Active connection
@@ -1905,9 +2393,34 @@ class MusicConnection:
     
     def draw(self):
         """Draw the appropriate screen based on current state"""
+        # Nobody sees frames while the window is minimized or hidden,
+        # so skip rendering entirely; playback and networking keep
+        # running on their own threads regardless
+        if not pygame.display.get_active():
+            # Force a full repaint on restore; the framebuffer contents
+            # are not guaranteed to survive minimization
+            self._last_draw_signature = object()
+            return
+
+        # The menu screens are static between state changes, so skip the
+        # full clear/redraw/flip when nothing visible has moved - the
+        # previously presented frame stays on screen. The playing screen
+        # animates continuously and always repaints
+        if self.state == PLAYING_MODE:
+            signature = None
+        else:
+            signature = (self.state, self.connection_status,
+                         self.selected_role, self.selected_slave_index,
+                         active_slaves_revision, self.track_name,
+                         self.local_instrument, self.remote_instrument,
+                         len(self.parsed_song_data))
+        if signature is not None and signature == self._last_draw_signature:
+            return
+        self._last_draw_signature = signature
+
         # Clear screen
         self.screen.fill(BG_COLOR)
-        
+
         # Draw appropriate screen based on state
         if self.state == ROLE_SELECTION:
             self.draw_role_selection()
@@ -1921,7 +2434,7 @@ class MusicConnection:
             self.draw_active_connection()
         elif self.state == PLAYING_MODE:
             self.draw_playing_screen()
-        
+
         # Update display
         pygame.display.flip()
     
@@ -1931,11 +2444,18 @@ class MusicConnection:
         while running:
             running = self.handle_events()
             self.draw()
-            self.clock.tick(60)
+            # Only the playing screen animates; the menu screens just
+            # poll for input, so a 15Hz tick is plenty there - and a
+            # hidden window only needs the loop alive for events
+            if not pygame.display.get_active():
+                self.clock.tick(10)
+            else:
+                self.clock.tick(60 if self.state == PLAYING_MODE else 15)
         
         # Make sure to clean up network resources
         self.cleanup()
-        
+        self._executor.shutdown(wait=False)
+
         pygame.quit()
 
 def main():
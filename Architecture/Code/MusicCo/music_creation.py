@@ -3,6 +3,8 @@
 
 import pygame
 import numpy as np
+import bisect
+import collections
 import time
 import os
 from constants import (
@@ -35,6 +37,12 @@ GUITAR_NOTE_POSITIONS = {
 # Section divider position
 SECTION_DIVIDER_Y = 350
 
+# Composition entries: a namedtuple instead of a 6-key dict per note -
+# far smaller, and attribute access on the draw/save paths is a C-level
+# slot lookup rather than a string-hash probe
+Note = collections.namedtuple(
+    'Note', ('note', 'octave', 'start', 'duration', 'volume', 'instrument'))
+
 class MusicCreator:
     def __init__(self):
         # Initialize pygame
@@ -48,12 +56,39 @@ class MusicCreator:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.clock = pygame.time.Clock()
-        
-        # Generate note colors
+
+        # The creator only reacts to key presses and quit; keep the
+        # noisy event types (mouse motion floods especially) out of the
+        # SDL queue entirely so they are never wrapped in Python objects
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT,
+                                  pygame.JOYAXISMOTION])
+        
+        # Generate note colors, plus the brightened electro-guitar
+        # variant of each so it is never rebuilt per note
         self.note_colors = calculate_note_colors()
+        self.note_colors_guitar = {
+            name: pygame.Color(min(255, c.r + 40), c.g, min(255, c.b + 40))
+            for name, c in self.note_colors.items()
+        }
         
-        # Composition data
+        # Composition data, kept sorted by start time on insert so the
+        # draw and save paths never need to re-sort it. _starts mirrors
+        # the start times for bisect
         self.composition = []
+        self._starts = []
+
+        # Occupied (note, half-second slot) pairs for O(1) collision
+        # probes; positions always land on the 0.5s grid, so the slot is
+        # just the start time doubled and rounded
+        self._occupied = set()
+
+        # NumPy columns mirroring the composition's start times and
+        # durations, rebuilt on add/delete; the ribbon computes every
+        # note's x and width in two vector ops instead of per-note
+        # Python arithmetic (same pattern as the connection module's
+        # playback arrays)
+        self._col_starts = np.zeros(0, dtype=np.float32)
+        self._col_durations = np.zeros(0, dtype=np.float32)
         
         # Current state
         self.state = NOTE_SELECTION
@@ -68,34 +103,198 @@ class MusicCreator:
         # Keep track of the maximum position for display purposes
         self.max_position = 10.0  # Initial timeline length
         
-        # Key to note mapping
+        # Key to note mapping, plus the inverse for note -> key-cap
+        # lookups so nothing has to scan the forward dict
         self.key_to_note = KEY_MAPPINGS
-        
+        self._note_to_keyname = {
+            note: pygame.key.name(key).upper()
+            for key, note in self.key_to_note.items()
+        }
+
         # Time conversions
         self.position_increment = 0.5  # Position increments by 0.5 seconds
-    
+
+        # The scene only changes in response to input, so run() redraws
+        # only when this is set (initially, and after each key press).
+        # When every change in a batch touched only the header strip
+        # (octave/length readouts), _partial stays True and draw() pushes
+        # just that strip to the screen instead of flipping the frame
+        self._dirty = True
+        self._partial = False
+        self._header_rect = pygame.Rect(0, 0, WIDTH, 170)
+
+        # Pre-rendered text surfaces for every label that never changes;
+        # the draw methods blit these instead of re-rasterizing the same
+        # strings through SDL_ttf 60 times a second
+        self._cached_surfaces = {}
+        self._build_surface_cache()
+
+        # Pre-composed full-screen backgrounds (divider, section labels,
+        # active-section highlight, keyboard guide), one per instrument
+        # selection; draw() blits the right one instead of re-issuing
+        # all of those draw calls every frame
+        self._backgrounds = {}
+        self._build_backgrounds()
+
+        # Per-(note, octave, instrument) draw state for the ribbon:
+        # everything except start_x/width is a pure function of those
+        # three fields, so compute it once per distinct key
+        self._note_render_cache = {}
+
+        # Cached timeline ruler strip (baseline, tick marks, second
+        # labels), rebuilt only when max_position rescales the timeline
+        self._ruler_surface = None
+        self._ruler_max_position = None
+
+        # Scratch geometry reused across the ribbon loop instead of
+        # allocating a rect tuple and triangle vertex list per note
+        self._scratch_rect = pygame.Rect(0, 0, 0, 0)
+        self._scratch_poly = [[0, 0], [0, 0], [0, 0]]
+
+    def _mark_dirty(self, header_only=False):
+        """Request a redraw; a full one unless only the header changed"""
+        if not self._dirty:
+            self._partial = header_only
+        elif not header_only:
+            self._partial = False
+        self._dirty = True
+
+    def _rebuild_layout_columns(self):
+        """Refresh the start/duration columns after a composition change"""
+        count = len(self.composition)
+        self._col_starts = np.fromiter(
+            (n.start for n in self.composition), dtype=np.float32, count=count)
+        self._col_durations = np.fromiter(
+            (n.duration for n in self.composition), dtype=np.float32, count=count)
+
+    def _build_surface_cache(self):
+        """Pre-render all static text labels into reusable surfaces"""
+        cache = self._cached_surfaces
+        highlight_color = pygame.Color(255, 255, 100)
+
+        # Keyboard guide lines: one per note in the normal note color,
+        # plus a yellow variant for when that note is selected. Rendered
+        # with the background color so the highlight variant fully
+        # covers the normal one when blitted on top
+        for note_name in PIANO_NOTE_POSITIONS:
+            key_name = self._note_to_keyname.get(note_name)
+            if key_name is None:
+                continue
+            guide_text = f"Press '{key_name}' for {note_name}"
+            cache[('kbguide', note_name, False)] = self.font.render(
+                guide_text, True, self.note_colors[note_name], BG_COLOR).convert()
+            cache[('kbguide', note_name, True)] = self.font.render(
+                guide_text, True, highlight_color, BG_COLOR).convert()
+
+        # Note length options, in selected (yellow) and idle (grey).
+        # These can overlap the keyboard guide lines, so they keep
+        # per-pixel alpha rather than an opaque background box
+        for length in NOTE_LENGTHS:
+            cache[('length', length, True)] = self.font.render(f"{length}s", True, (255, 255, 0)).convert_alpha()
+            cache[('length', length, False)] = self.font.render(f"{length}s", True, (150, 150, 150)).convert_alpha()
+
+        # Section divider labels and active-section markers; rendered
+        # with the background color so the opaque surfaces stay readable
+        # after pixel-format conversion (converting a background-less
+        # render drops its alpha and leaves a solid bar of text color)
+        cache[('section', 'piano')] = self.font.render("Piano", True, (200, 200, 200), BG_COLOR).convert()
+        cache[('section', 'guitar')] = self.font.render("Electro Guitar", True, (200, 200, 100), BG_COLOR).convert()
+        cache[('active', 'piano')] = self.small_font.render("Current active section", True, (200, 200, 200), BG_COLOR).convert()
+        cache[('active', 'guitar')] = self.small_font.render("Current active section", True, (200, 200, 100), BG_COLOR).convert()
+
+        # State headers and hints that are truly constant
+        cache['note_header'] = self.font.render("Select a note (number keys)", True, TEXT_COLOR, BG_COLOR).convert()
+        cache['instrument_hint'] = self.small_font.render("Press 'A' to toggle instrument", True, (200, 200, 100), BG_COLOR).convert()
+        cache['length_hint'] = self.small_font.render("Press 'A' to cycle through lengths, SPACE to confirm", True, TEXT_COLOR, BG_COLOR).convert()
+        cache['position_hint'] = self.small_font.render("Press 'A' to move position, SPACE to add note", True, TEXT_COLOR, BG_COLOR).convert()
+        cache['cancel_hint'] = self.small_font.render("Press BACKSPACE or DELETE to cancel", True, TEXT_COLOR, BG_COLOR).convert()
+        cache['controls'] = self.small_font.render(
+            "BACKSPACE: Delete last note | CTRL+S: Save | ESC: Exit",
+            True, (200, 200, 200), BG_COLOR).convert()
+
+    def _build_backgrounds(self):
+        """Compose the static scene background for each instrument"""
+        highlight_color = (70, 70, 100)
+        for section, instrument in (('piano', INSTRUMENTS["PIANO"]),
+                                    ('guitar', INSTRUMENTS["ELECTRO_GUITAR"])):
+            bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+            bg.fill(BG_COLOR)
+
+            # Section divider and labels
+            pygame.draw.line(bg, (100, 100, 100), (0, SECTION_DIVIDER_Y),
+                             (WIDTH, SECTION_DIVIDER_Y), 2)
+            bg.blit(self._cached_surfaces[('section', 'piano')], (20, SECTION_DIVIDER_Y - 40))
+            bg.blit(self._cached_surfaces[('section', 'guitar')], (20, SECTION_DIVIDER_Y + 10))
+
+            # Highlight for the active instrument section
+            if instrument == INSTRUMENTS["PIANO"]:
+                pygame.draw.rect(bg, highlight_color, (0, 0, WIDTH, SECTION_DIVIDER_Y), 2)
+                bg.blit(self._cached_surfaces[('active', 'piano')],
+                        (WIDTH - 200, SECTION_DIVIDER_Y - 40))
+            else:
+                pygame.draw.rect(bg, highlight_color,
+                                 (0, SECTION_DIVIDER_Y, WIDTH, HEIGHT - SECTION_DIVIDER_Y), 2)
+                bg.blit(self._cached_surfaces[('active', 'guitar')],
+                        (WIDTH - 200, SECTION_DIVIDER_Y + 10))
+
+            # Keyboard guide lines in both sections (non-highlighted;
+            # the selected note's highlight is overlaid in draw)
+            for note_name, y_pos in PIANO_NOTE_POSITIONS.items():
+                guide = self._cached_surfaces.get(('kbguide', note_name, False))
+                if guide:
+                    bg.blit(guide, (50, y_pos))
+            for note_name, y_pos in GUITAR_NOTE_POSITIONS.items():
+                guide = self._cached_surfaces.get(('kbguide', note_name, False))
+                if guide:
+                    bg.blit(guide, (50, y_pos))
+
+            self._backgrounds[instrument] = bg
+
+    def _note_render_state(self, note_name, octave, instrument):
+        """Static ribbon draw state for one (note, octave, instrument).
+
+        Returns (y_pos, color, label surface, label width), computed on
+        first use and reused every frame after.
+        """
+        key = (note_name, octave, instrument)
+        state = self._note_render_cache.get(key)
+        if state is None:
+            y_pos = self.get_note_y_position(note_name, instrument)
+            # Electro guitar gets the pre-brightened variant
+            color = (self.note_colors_guitar[note_name]
+                     if instrument == INSTRUMENTS["ELECTRO_GUITAR"]
+                     else self.note_colors[note_name])
+            # Labels sit on top of the colored note rect, so keep the
+            # per-pixel alpha (convert_alpha, not convert)
+            label = self.small_font.render(f"{note_name}{octave}", True, TEXT_COLOR).convert_alpha()
+            state = (y_pos, color, label, label.get_width())
+            self._note_render_cache[key] = state
+        return state
+
+    def _tick_label(self, i):
+        """Timeline second label, rendered once per distinct value"""
+        label = self._cached_surfaces.get(('tick', i))
+        if label is None:
+            # Per-pixel alpha: the label lands on the SRCALPHA ruler strip
+            label = self.small_font.render(f"{i}s", True, (150, 150, 150)).convert_alpha()
+            self._cached_surfaces[('tick', i)] = label
+        return label
+
     def save_composition(self, filename="track.txt"):
         """Save the composition to a file"""
         if not self.composition:
             return False
-        
-        # Sort notes by position
-        sorted_notes = sorted(self.composition, key=lambda x: x['Start Time'])
-        
-        # Format each note as per the expected format
-        formatted_notes = []
-        for note in sorted_notes:
-            # Include instrument in the saved format
-            formatted_note = f"{note['Note']}{note['Octave']}-{note['Start Time']}-{note['Duration']}-{note['Volume']}-{note['Instrument']}"
-            formatted_notes.append(formatted_note)
-        
-        # Join with spaces
-        output = " ".join(formatted_notes)
-        
-        # Write to file
+
+        # Stream each formatted note straight into a generously buffered
+        # file instead of building the full joined string in memory
+        # first; the composition is already sorted by start time
         try:
-            with open(filename, 'w') as file:
-                file.write(output)
+            with open(filename, 'w', buffering=1 << 17) as file:
+                separator = ""
+                for note in self.composition:
+                    # Include instrument in the saved format
+                    file.write(f"{separator}{note.note}{note.octave}-{note.start}-{note.duration}-{note.volume}-{note.instrument}")
+                    separator = " "
             return True
         except Exception as e:
             print(f"Error saving composition: {e}")
@@ -106,22 +305,30 @@ class MusicCreator:
         if self.selected_note is None:
             return
         
-        note_data = {
-            'Note': self.selected_note,
-            'Octave': self.selected_octave,
-            'Start Time': self.position,
-            'Duration': NOTE_LENGTHS[self.length_index],
-            'Volume': 100,  # Fixed volume for now
-            'Instrument': self.selected_instrument  # Add instrument information
-        }
+        note_data = Note(
+            self.selected_note,
+            self.selected_octave,
+            self.position,
+            NOTE_LENGTHS[self.length_index],
+            100,  # Fixed volume for now
+            self.selected_instrument
+        )
         
         # Check if the position extends beyond current max
         new_end_time = self.position + NOTE_LENGTHS[self.length_index]
         if new_end_time > self.max_position:
             self.max_position = new_end_time + 2  # Add some extra space
         
-        # Add the note to the composition
-        self.composition.append(note_data)
+        # Warm the ribbon draw-state cache for this note up front
+        self._note_render_state(self.selected_note, self.selected_octave,
+                                self.selected_instrument)
+
+        # Insert the note at its sorted position
+        idx = bisect.bisect_right(self._starts, self.position)
+        self._starts.insert(idx, self.position)
+        self.composition.insert(idx, note_data)
+        self._occupied.add((self.selected_note, round(self.position * 2)))
+        self._rebuild_layout_columns()
         
         # Play the note once with the selected instrument
         play_note(
@@ -146,11 +353,23 @@ class MusicCreator:
     
     def handle_events(self):
         """Handle user input"""
-        for event in pygame.event.get():
+        # Fetch only the event types we act on; everything else stays in
+        # (or never enters) the queue
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 return False
             
             if event.type == pygame.KEYDOWN:
+                # Octave stepping and length cycling only change the
+                # header readouts; everything else (notes, highlights,
+                # the position marker) spans most of the window, so it
+                # gets a full redraw
+                self._mark_dirty(header_only=(
+                    (self.state == NOTE_SELECTION
+                     and event.key in (pygame.K_UP, pygame.K_DOWN))
+                    or (self.state == LENGTH_SELECTION
+                        and event.key == pygame.K_a)))
+
                 # Escape key to exit
                 if event.key == pygame.K_ESCAPE:
                     return False
@@ -167,8 +386,13 @@ class MusicCreator:
                         self.state = NOTE_SELECTION
                         self.selected_note = None
                     elif self.state == NOTE_SELECTION and self.composition:
-                        # Delete the last note from the composition
-                        self.composition.pop()
+                        # Delete the last note (latest start time) from
+                        # the composition
+                        removed = self.composition.pop()
+                        self._starts.pop()
+                        self._occupied.discard(
+                            (removed.note, round(removed.start * 2)))
+                        self._rebuild_layout_columns()
                         # Set position to 0 to follow the requirement
                         self.position = 0.0
                 
@@ -214,15 +438,13 @@ class MusicCreator:
                             )
                             
                     elif self.state == POSITION_SELECTION:
-                        # Increment position
+                        # Increment position, skipping slots this note
+                        # already occupies - a set probe per step
+                        # instead of a scan over the composition
                         self.position += self.position_increment
-                        
-                        # Check for collisions with existing notes
-                        for note in self.composition:
-                            if (abs(note['Start Time'] - self.position) < 0.1 and 
-                                note['Note'] == self.selected_note):
-                                # Skip this position
-                                self.position += self.position_increment
+                        while (self.selected_note,
+                               round(self.position * 2)) in self._occupied:
+                            self.position += self.position_increment
                 
                 # Confirm current selection and move to next state
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
@@ -242,37 +464,11 @@ class MusicCreator:
         else:  # ELECTRO_GUITAR
             return GUITAR_NOTE_POSITIONS.get(note_name, 540)  # Default position if note not found
     
-    def draw_section_divider(self):
-        """Draw a divider between piano and guitar sections with labels"""
-        # Draw horizontal divider line
-        pygame.draw.line(self.screen, (100, 100, 100), (0, SECTION_DIVIDER_Y), (WIDTH, SECTION_DIVIDER_Y), 2)
-        
-        # Draw section labels
-        piano_label = self.font.render("Piano", True, (200, 200, 200))
-        guitar_label = self.font.render("Electro Guitar", True, (200, 200, 100))
-        
-        # Position labels on the left side
-        self.screen.blit(piano_label, (20, SECTION_DIVIDER_Y - 40))
-        self.screen.blit(guitar_label, (20, SECTION_DIVIDER_Y + 10))
-        
-        # Add highlight for current instrument section
-        highlight_color = (70, 70, 100, 128)  # Semi-transparent highlight
-        if self.selected_instrument == INSTRUMENTS["PIANO"]:
-            # Highlight piano section
-            pygame.draw.rect(self.screen, highlight_color, (0, 0, WIDTH, SECTION_DIVIDER_Y), 2)
-            active_text = self.small_font.render("Current active section", True, (200, 200, 200))
-            self.screen.blit(active_text, (WIDTH - 200, SECTION_DIVIDER_Y - 40))
-        else:
-            # Highlight guitar section
-            pygame.draw.rect(self.screen, highlight_color, (0, SECTION_DIVIDER_Y, WIDTH, HEIGHT - SECTION_DIVIDER_Y), 2)
-            active_text = self.small_font.render("Current active section", True, (200, 200, 100))
-            self.screen.blit(active_text, (WIDTH - 200, SECTION_DIVIDER_Y + 10))
-    
     def draw_note_ribbon(self):
         """Draw a ribbon showing all notes in the composition"""
-        # Sort notes by position
-        sorted_notes = sorted(self.composition, key=lambda x: x['Start Time'])
-        
+        # Already sorted by start time (maintained on insert)
+        sorted_notes = self.composition
+
         # Draw timeline
         timeline_y = HEIGHT - 100
         timeline_start = 50
@@ -281,63 +477,64 @@ class MusicCreator:
         
         # Calculate scale: pixels per second
         pixels_per_second = timeline_length / self.max_position
+
+        # Rebuild the ruler strip only when the timeline rescales; the
+        # per-frame cost is otherwise a single blit
+        if self.max_position != self._ruler_max_position:
+            ruler = pygame.Surface((WIDTH, 40), pygame.SRCALPHA).convert_alpha()
+            # Baseline sits at local y 5 (timeline_y - 5 on screen)
+            pygame.draw.line(ruler, (150, 150, 150),
+                             (timeline_start, 5), (timeline_end, 5), 2)
+            for i in range(0, int(self.max_position) + 1, 1):
+                marker_x = timeline_start + i * pixels_per_second
+                pygame.draw.line(ruler, (100, 100, 100),
+                                 (marker_x, 0), (marker_x, 10), 1)
+                # Add time labels for whole seconds (every other second
+                # to avoid crowding)
+                if i % 2 == 0:
+                    ruler.blit(self._tick_label(i), (marker_x - 10, 15))
+            self._ruler_surface = ruler
+            self._ruler_max_position = self.max_position
+
+        self.screen.blit(self._ruler_surface, (0, timeline_y - 5))
         
-        # Draw the timeline
-        pygame.draw.line(self.screen, (150, 150, 150), 
-                         (timeline_start, timeline_y), 
-                         (timeline_end, timeline_y), 2)
-        
-        # Draw time markers
-        for i in range(0, int(self.max_position) + 1, 1):
-            marker_x = timeline_start + i * pixels_per_second
-            pygame.draw.line(self.screen, (100, 100, 100),
-                           (marker_x, timeline_y - 5),
-                           (marker_x, timeline_y + 5), 1)
-            
-            # Add time labels for whole seconds
-            if i % 2 == 0:  # Only show every other second to avoid crowding
-                time_label = self.small_font.render(f"{i}s", True, (150, 150, 150))
-                self.screen.blit(time_label, (marker_x - 10, timeline_y + 10))
-        
-        # Draw each note as a colored rectangle
+        # Draw each note as a colored rectangle; the static per-note
+        # state (y, color, label) comes from the render cache, so only
+        # start_x and width are computed per frame
         note_height = 20
-        for note in sorted_notes:
-            start_x = timeline_start + note['Start Time'] * pixels_per_second
-            width = note['Duration'] * pixels_per_second
-            
-            # Get the note and instrument
-            note_name = note['Note']
-            instrument = note.get('Instrument', INSTRUMENTS["PIANO"])
-            
-            # Y position based on note and instrument
-            y_pos = self.get_note_y_position(note_name, instrument)
-            
-            # Get base color
-            base_color = self.note_colors[note_name]
-            
-            # Determine color based on instrument
+        # All x positions and widths in two vectorized passes
+        xs = timeline_start + self._col_starts * pixels_per_second
+        widths = self._col_durations * pixels_per_second
+        for i, note in enumerate(sorted_notes):
+            start_x = xs[i]
+            width = widths[i]
+
+            instrument = note.instrument
+            y_pos, color, label, label_width = self._note_render_state(
+                note.note, note.octave, instrument)
+
             if instrument == INSTRUMENTS["ELECTRO_GUITAR"]:
-                # Electro guitar gets a more intense color
-                color = pygame.Color(
-                    min(255, base_color.r + 40),
-                    base_color.g,
-                    min(255, base_color.b + 40)
-                )
-                
-                # Add a small guitar icon or indicator
-                pygame.draw.polygon(self.screen, (255, 255, 255), 
-                                  [(start_x + 2, y_pos + 2), 
-                                   (start_x + 7, y_pos + 10), 
-                                   (start_x + 2, y_pos + 18)])
-            else:
-                color = base_color
-            
-            # Draw note rectangle
-            pygame.draw.rect(self.screen, color, (start_x, y_pos, width, note_height))
-            
+                # Add a small guitar icon or indicator (vertices written
+                # into the reused scratch list)
+                poly = self._scratch_poly
+                poly[0][0] = start_x + 2
+                poly[0][1] = y_pos + 2
+                poly[1][0] = start_x + 7
+                poly[1][1] = y_pos + 10
+                poly[2][0] = start_x + 2
+                poly[2][1] = y_pos + 18
+                pygame.draw.polygon(self.screen, (255, 255, 255), poly)
+
+            # Draw note rectangle via the reused scratch rect
+            rect = self._scratch_rect
+            rect.x = int(start_x)
+            rect.y = y_pos
+            rect.width = int(width)
+            rect.height = note_height
+            pygame.draw.rect(self.screen, color, rect)
+
             # Add note label
-            label = self.small_font.render(f"{note['Note']}{note['Octave']}", True, TEXT_COLOR)
-            if width > label.get_width() + 10:  # Only show label if enough space
+            if width > label_width + 10:  # Only show label if enough space
                 self.screen.blit(label, (start_x + 5, y_pos + 2))
         
         # Draw position marker for current position
@@ -356,44 +553,6 @@ class MusicCreator:
                             (marker_x, marker_y1), 
                             (marker_x, marker_y2), 2)
     
-    def draw_keyboard_guide(self):
-        """Draw a guide showing which keys correspond to which notes"""
-        # Draw piano section key guide
-        for i, (note_name, y_pos) in enumerate(PIANO_NOTE_POSITIONS.items()):
-            # Find the key that maps to this note
-            key_name = None
-            for key, note in self.key_to_note.items():
-                if note == note_name:
-                    key_name = pygame.key.name(key).upper()
-                    break
-            
-            if key_name:
-                # Draw key name for piano section
-                color = self.note_colors[note_name]
-                if self.selected_instrument == INSTRUMENTS["PIANO"] and self.selected_note == note_name:
-                    # Highlight selected note in current instrument
-                    color = pygame.Color(255, 255, 100)
-                key_text = self.font.render(f"Press '{key_name}' for {note_name}", True, color)
-                self.screen.blit(key_text, (50, y_pos))
-        
-        # Draw guitar section key guide
-        for i, (note_name, y_pos) in enumerate(GUITAR_NOTE_POSITIONS.items()):
-            # Find the key that maps to this note
-            key_name = None
-            for key, note in self.key_to_note.items():
-                if note == note_name:
-                    key_name = pygame.key.name(key).upper()
-                    break
-            
-            if key_name:
-                # Draw key name for guitar section
-                color = self.note_colors[note_name]
-                if self.selected_instrument == INSTRUMENTS["ELECTRO_GUITAR"] and self.selected_note == note_name:
-                    # Highlight selected note in current instrument
-                    color = pygame.Color(255, 255, 100)
-                key_text = self.font.render(f"Press '{key_name}' for {note_name}", True, color)
-                self.screen.blit(key_text, (50, y_pos))
-    
     def draw_state_info(self):
         """Draw information about the current state and selection"""
         # Always show current instrument
@@ -401,62 +560,55 @@ class MusicCreator:
         self.screen.blit(instrument_text, (WIDTH - 300, 20))
         
         if self.state == NOTE_SELECTION:
-            state_text = self.font.render("Select a note (number keys)", True, TEXT_COLOR)
-            self.screen.blit(state_text, (WIDTH//2 - 150, 20))
-            
-            instrument_hint = self.small_font.render("Press 'A' to toggle instrument", True, (200, 200, 100))
-            self.screen.blit(instrument_hint, (WIDTH//2 - 150, 60))
-            
+            self.screen.blit(self._cached_surfaces['note_header'], (WIDTH//2 - 150, 20))
+            self.screen.blit(self._cached_surfaces['instrument_hint'], (WIDTH//2 - 150, 60))
+
             octave_text = self.font.render(f"Current Octave: {self.selected_octave} (↑/↓ to change)", True, TEXT_COLOR)
             self.screen.blit(octave_text, (WIDTH//2 - 150, 90))
-            
+
         elif self.state == LENGTH_SELECTION:
             state_text = self.font.render(f"Select note length: {NOTE_LENGTHS[self.length_index]}s", True, TEXT_COLOR)
             self.screen.blit(state_text, (WIDTH//2 - 150, 20))
-            
-            hint_text = self.small_font.render("Press 'A' to cycle through lengths, SPACE to confirm", True, TEXT_COLOR)
-            self.screen.blit(hint_text, (WIDTH//2 - 200, 60))
-            
-            cancel_text = self.small_font.render("Press BACKSPACE or DELETE to cancel", True, TEXT_COLOR)
-            self.screen.blit(cancel_text, (WIDTH//2 - 150, 90))
-            
+
+            self.screen.blit(self._cached_surfaces['length_hint'], (WIDTH//2 - 200, 60))
+            self.screen.blit(self._cached_surfaces['cancel_hint'], (WIDTH//2 - 150, 90))
+
             # Show the different length options
             options_y = 130
             for i, length in enumerate(NOTE_LENGTHS):
-                color = (255, 255, 0) if i == self.length_index else (150, 150, 150)
-                option_text = self.font.render(f"{length}s", True, color)
+                option_text = self._cached_surfaces[('length', length, i == self.length_index)]
                 self.screen.blit(option_text, (50 + i * 100, options_y))
-            
+
         elif self.state == POSITION_SELECTION:
             state_text = self.font.render(f"Select position: {self.position:.1f}s", True, TEXT_COLOR)
             self.screen.blit(state_text, (WIDTH//2 - 150, 20))
-            
-            hint_text = self.small_font.render("Press 'A' to move position, SPACE to add note", True, TEXT_COLOR)
-            self.screen.blit(hint_text, (WIDTH//2 - 200, 60))
-            
-            cancel_text = self.small_font.render("Press BACKSPACE or DELETE to cancel", True, TEXT_COLOR)
-            self.screen.blit(cancel_text, (WIDTH//2 - 150, 90))
+
+            self.screen.blit(self._cached_surfaces['position_hint'], (WIDTH//2 - 200, 60))
+            self.screen.blit(self._cached_surfaces['cancel_hint'], (WIDTH//2 - 150, 90))
     
     def draw_controls_guide(self):
         """Draw a guide for the controls"""
         controls_y = HEIGHT - 40
-        controls_text = self.small_font.render(
-            "BACKSPACE: Delete last note | CTRL+S: Save | ESC: Exit", 
-            True, (200, 200, 200)
-        )
+        controls_text = self._cached_surfaces['controls']
         self.screen.blit(controls_text, (WIDTH//2 - controls_text.get_width()//2, controls_y))
     
     def draw(self):
         """Draw the interface"""
-        # Clear screen
-        self.screen.fill(BG_COLOR)
-        
-        # Draw section divider
-        self.draw_section_divider()
-        
-        # Draw keyboard guide
-        self.draw_keyboard_guide()
-        
+        # Blit the pre-composed background (clears the screen and draws
+        # the divider, section highlight and keyboard guide in one copy)
+        self.screen.blit(self._backgrounds[self.selected_instrument], (0, 0))
+
+        # Overlay the highlight variant of the selected note's guide
+        # line; the opaque surface fully covers the normal one beneath
+        if self.selected_note is not None:
+            positions = (PIANO_NOTE_POSITIONS
+                         if self.selected_instrument == INSTRUMENTS["PIANO"]
+                         else GUITAR_NOTE_POSITIONS)
+            y_pos = positions.get(self.selected_note)
+            highlight = self._cached_surfaces.get(('kbguide', self.selected_note, True))
+            if y_pos is not None and highlight:
+                self.screen.blit(highlight, (50, y_pos))
+
         # Draw state-specific information
         self.draw_state_info()
         
@@ -466,15 +618,24 @@ class MusicCreator:
         # Draw controls guide
         self.draw_controls_guide()
         
-        # Update display
-        pygame.display.flip()
+        # Push the frame: just the header strip when nothing below it
+        # changed, otherwise the whole window
+        if self._partial:
+            pygame.display.update(self._header_rect)
+        else:
+            pygame.display.flip()
     
     def run(self):
         """Main loop"""
         running = True
         while running:
             running = self.handle_events()
-            self.draw()
+            # Redraw only when input changed something; the display is
+            # double-buffered so the last flipped frame persists
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+                self._partial = False
             self.clock.tick(60)
         
         # Clean up
@@ -1,48 +1,49 @@
+import re
+
 from constants import INSTRUMENTS
 
+# One anchored match pulls every field out of an entry in a single pass:
+# note name, octave, start time, duration, volume and the optional
+# instrument. This replaces a hyphen split plus two character-at-a-time
+# scans of the note/octave token with one C-level regex call per entry.
+_ENTRY_RE = re.compile(
+    r'^([A-Za-z]+)(\d+)-(\d+(?:\.\d+)?)-(\d+(?:\.\d+)?)-(\d+)(?:-(\d+))?$')
+
 def parse_music_data(input_data):
     """
     Parses a string of musical note data into a structured list of dictionaries.
-   
+
     Args:
         input_data (str): The input string containing note data in the format
                           <Note><Octave>-<Start Time>-<Duration>-<Volume>[-<Instrument>].
-                         
+
     Returns:
         list: A list of dictionaries with parsed note data.
     """
 
-    entries = input_data.split()
     parsed_data = []
-   
-    for entry in entries:
-        # Split by hyphens
-        parts = entry.split('-')
-        
-        # Handle both old format (without instrument) and new format (with instrument)
-        if len(parts) == 4:
-            # Old format: note_octave-start_time-duration-volume
-            note_octave, start_time, duration, volume = parts
-            instrument = INSTRUMENTS["PIANO"]  # Default to piano for backward compatibility
-        elif len(parts) == 5:
-            # New format: note_octave-start_time-duration-volume-instrument
-            note_octave, start_time, duration, volume, instrument = parts
-            instrument = int(instrument)
-        else:
+    # Bind the conversions and the default instrument locally; the loop
+    # body runs once per note and global lookups add up on large files
+    _int = int
+    _float = float
+    _piano = INSTRUMENTS["PIANO"]
+
+    for entry in input_data.split():
+        match = _ENTRY_RE.match(entry)
+        if match is None:
             print(f"Warning: Skipping malformed entry: {entry}")
             continue
-            
-        # Separate note and octave
-        note = ''.join([c for c in note_octave if not c.isdigit()])
-        octave = ''.join([c for c in note_octave if c.isdigit()])
 
+        note, octave, start_time, duration, volume, instrument = match.groups()
         parsed_data.append({
             'Note': note,
-            'Octave': int(octave),
-            'Start Time': float(start_time),
-            'Duration': float(duration),
-            'Volume': int(volume),
-            'Instrument': instrument
+            'Octave': _int(octave),
+            'Start Time': _float(start_time),
+            'Duration': _float(duration),
+            'Volume': _int(volume),
+            # Entries without an instrument field predate the instrument
+            # column and default to piano for backward compatibility
+            'Instrument': _piano if instrument is None else _int(instrument)
         })
-   
-    return parsed_data
\ No newline at end of file
+
+    return parsed_data
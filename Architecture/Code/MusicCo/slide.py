@@ -2,11 +2,12 @@
 
 import pygame
 import time
-from constants import KEY_MAPPINGS, WIDTH, HEIGHT, BG_COLOR, FREQS, TEXT_COLOR, INSTRUMENTS, INSTRUMENT_NAMES
+import numpy as np
+from constants import KEY_MAPPINGS, WIDTH, HEIGHT, BG_COLOR, FREQS, TEXT_COLOR, INSTRUMENTS, INSTRUMENT_NAMES, NOTE_SPEED, THRESHOLD_X
 from sound_engine import play_note, play_error_sound
 from visualizer import (
     init_pygame_window, calculate_note_colors, prepare_song_data,
-    get_visible_notes, update_missed_notes, find_active_notes,
+    get_visible_notes, update_missed_notes,
     draw_instruction_screen, draw_game_screen, draw_game_over_screen, draw_pre_play_screen,
     get_note_y_position, PIANO_NOTE_POSITIONS, GUITAR_NOTE_POSITIONS, SECTION_DIVIDER_Y
 )
@@ -25,14 +26,38 @@ class SlidePlayGame:
         # Default instrument - now can be overridden per note or globally
         self.current_instrument = INSTRUMENTS["PIANO"]
         
+        # Column arrays over the song data; the aggregate queries below
+        # (and any later whole-song math) run vectorized over these
+        # instead of scanning the list of dicts
+        note_count = len(song_data)
+        self._start_col = np.fromiter(
+            (n['Start Time'] for n in song_data), dtype=np.float64, count=note_count)
+        self._duration_col = np.fromiter(
+            (n['Duration'] for n in song_data), dtype=np.float64, count=note_count)
+        self._octave_col = np.fromiter(
+            (n['Octave'] for n in song_data), dtype=np.int64, count=note_count)
+
+        # Appear-time column and a mask of notes still eligible for a
+        # hit; process_key_event filters candidates in one vectorized
+        # pass per keypress instead of scanning every note in Python
+        travel_time = (WIDTH - THRESHOLD_X) / NOTE_SPEED
+        self._appear_col = self._start_col - travel_time
+        self._unplayed = np.ones(note_count, dtype=bool)
+        for index, note in enumerate(self.song_data):
+            note['_index'] = index
+
+        # Notes not yet played, missed or hit wrong; each note flips to
+        # exactly one of those states at most once, so the end-of-game
+        # check is a counter compare instead of a scan over the song
+        self.unhandled = note_count
+
         # Calculate last note time for ending the game
-        self.last_note_time = max([n['Start Time'] + n['Duration'] for n in song_data]) if song_data else 0
-        
+        self.last_note_time = float((self._start_col + self._duration_col).max()) if song_data else 0
+
         # Calculate octave range for panning
         if octave_range is None:
-            all_octaves = [note['Octave'] for note in song_data]
-            self.min_octave = min(all_octaves)
-            self.max_octave = max(all_octaves)
+            self.min_octave = int(self._octave_col.min())
+            self.max_octave = int(self._octave_col.max())
             self.octave_range = max(1, self.max_octave - self.min_octave)
         else:
             self.min_octave, self.max_octave = octave_range
@@ -93,8 +118,17 @@ class SlidePlayGame:
                 'note': played_note
             }
             
-            # Find notes near the threshold
-            active_notes = find_active_notes(self.song_data, current_time)
+            # Find notes near the threshold with one vectorized pass
+            # over the appear-time column. Missed notes are necessarily
+            # past the proximity window (missed requires the note's
+            # right edge left of THRESHOLD_X - 40), so the mask only
+            # has to track played/wrong notes
+            x_positions = WIDTH - ((current_time - self._appear_col)
+                                   * NOTE_SPEED).astype(np.int64)
+            distances = np.abs(x_positions - THRESHOLD_X)
+            near = self._unplayed & (distances < 40)
+            active_notes = [(self.song_data[i], int(distances[i]))
+                            for i in np.nonzero(near)[0]]
             
             if active_notes:
                 # Filter active notes by instrument type if we're overriding
@@ -142,6 +176,8 @@ class SlidePlayGame:
                     
                     play_note(played_note, octave, duration, volume, pan, instrument)
                     closest_note['played'] = True
+                    self._unplayed[closest_note['_index']] = False
+                    self.unhandled -= 1
                     self.score += 1
                     self.correct_hits += 1
                     
@@ -159,6 +195,8 @@ class SlidePlayGame:
                 else:
                     # Wrong note!
                     closest_note['wrong'] = True  # Mark the note as wrong
+                    self._unplayed[closest_note['_index']] = False
+                    self.unhandled -= 1
                     play_error_sound()
                     self.wrong_notes += 1
                     
@@ -462,9 +500,12 @@ class SlidePlayGame:
                 # Process both keydown and keyup events for beat accuracy
                 self.process_key_event(event, current_time)
             
-            # Get visible notes and update missed notes
+            # Get visible notes and update missed notes; every newly
+            # missed note is one fewer left to handle
             visible_notes = get_visible_notes(self.song_data, current_time)
+            previous_missed = self.missed_notes
             self.missed_notes = update_missed_notes(visible_notes, current_time, self.missed_notes)
+            self.unhandled -= self.missed_notes - previous_missed
             
             # Draw game screen
             draw_game_screen(
@@ -482,8 +523,7 @@ class SlidePlayGame:
             self.clock.tick(60)
             
             # Check for game end
-            all_notes_handled = all(note['played'] or note['missed'] or note.get('wrong', False) for note in self.song_data)
-            if all_notes_handled and current_time > self.last_note_time + 2:
+            if self.unhandled == 0 and current_time > self.last_note_time + 2:
                 running = False
         
         # Show the final score with note summary
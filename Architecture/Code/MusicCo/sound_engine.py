@@ -143,10 +143,16 @@ def generate_error_sound(duration=0.3, sample_rate=SAMPLE_RATE):
     return np.column_stack((left_channel, right_channel))
 
 
+# Cache of rendered pygame Sound objects keyed by everything that shapes
+# the waveform. Synthesizing a note costs several numpy passes over ~44k
+# samples; replaying a cached Sound is an O(1) mixer dispatch, so repeated
+# notes (the common case in any song) skip the realtime synthesis entirely
+_sound_cache = {}
+
 def play_note(note, octave, duration, volume, pan=0.5, instrument=INSTRUMENTS["PIANO"]):
     """
     Plays a note using pygame sound in stereo.
-    
+
     Args:
         note: Musical note (Do, Re, Mi, etc.)
         octave: Octave number
@@ -156,32 +162,42 @@ def play_note(note, octave, duration, volume, pan=0.5, instrument=INSTRUMENTS["P
         instrument: Instrument type (from INSTRUMENTS constant)
     """
     if note in FREQS:
-        frequency = FREQS[note] * (2 ** (octave - OCTAVE_OFFSET))
-        
-        # Generate waveform based on instrument type
-        if instrument == INSTRUMENTS["ELECTRO_GUITAR"]:
-            wave = generate_electro_guitar_wave_stereo(frequency, duration, pan)
-        else:  # Default to piano
-            wave = generate_piano_wave_stereo(frequency, duration, pan)
-
-        # Ensure mixer is correctly initialized for stereo
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2)
-        elif pygame.mixer.get_init()[2] != 2:
-            pygame.mixer.quit()
-            pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2)
-
-        sound = pygame.sndarray.make_sound(wave)
+        cache_key = (note, octave, round(duration, 3), round(pan, 2), instrument)
+        sound = _sound_cache.get(cache_key)
+
+        if sound is None:
+            frequency = FREQS[note] * (2 ** (octave - OCTAVE_OFFSET))
+
+            # Generate waveform based on instrument type
+            if instrument == INSTRUMENTS["ELECTRO_GUITAR"]:
+                wave = generate_electro_guitar_wave_stereo(frequency, duration, pan)
+            else:  # Default to piano
+                wave = generate_piano_wave_stereo(frequency, duration, pan)
+
+            # Ensure mixer is correctly initialized for stereo
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2)
+            elif pygame.mixer.get_init()[2] != 2:
+                pygame.mixer.quit()
+                pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2)
+
+            sound = pygame.sndarray.make_sound(wave)
+            _sound_cache[cache_key] = sound
+
         sound.set_volume(volume / 100)
         sound.play()
 
 
+# The error sound is always the same waveform; render it lazily once
+_error_sound = None
+
 def play_error_sound(volume=80):
     """Play the error sound"""
-    wave = generate_error_sound()
-    sound = pygame.sndarray.make_sound(wave)
-    sound.set_volume(volume / 100)
-    sound.play()
+    global _error_sound
+    if _error_sound is None:
+        _error_sound = pygame.sndarray.make_sound(generate_error_sound())
+    _error_sound.set_volume(volume / 100)
+    _error_sound.play()
 
 
 # Initialize pygame mixer when this module is imported
@@ -23,15 +23,37 @@ GUITAR_NOTE_POSITIONS = {
 # Section divider position
 SECTION_DIVIDER_Y = 350
 
+def _hsv_to_rgb_int(hue):
+    """Integer HSV->RGB at full saturation and value.
+
+    hue is in degrees; plain 6-sector integer math, so callers get RGB
+    ints directly instead of round-tripping a tuple through the
+    pygame.Color.hsva setter.
+    """
+    sector, rem = divmod(hue % 360, 60)
+    up = rem * 255 // 60
+    down = 255 - up
+    if sector == 0:
+        return (255, up, 0)
+    if sector == 1:
+        return (down, 255, 0)
+    if sector == 2:
+        return (0, 255, up)
+    if sector == 3:
+        return (0, down, 255)
+    if sector == 4:
+        return (up, 0, 255)
+    return (255, 0, down)
+
 def calculate_note_colors():
     """Generate colors for each note type"""
+    # Hues are spread evenly over the note list; enumerate gives the
+    # index directly instead of rebuilding and scanning the key list
+    # once per note
+    span = max(1, len(FREQS) - 1)
     note_colors = {}
-    for note_name in FREQS.keys():
-        note_index = list(FREQS.keys()).index(note_name)
-        hue = int(note_index * 255 / (len(FREQS) - 1))
-        color = pygame.Color(0, 0, 0)
-        color.hsva = (hue, 100, 100, 100)
-        note_colors[note_name] = color
+    for note_index, note_name in enumerate(FREQS):
+        note_colors[note_name] = pygame.Color(*_hsv_to_rgb_int(note_index * 255 // span))
     return note_colors
 
 def init_pygame_window():